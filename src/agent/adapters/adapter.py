@@ -2,7 +2,7 @@ import asyncio
 from abc import ABC
 from typing import Any, Dict, Union
 
-from langfuse import get_client, observe
+from langfuse import get_client
 from loguru import logger
 from sqlalchemy import MetaData
 
@@ -10,6 +10,7 @@ from sqlalchemy import MetaData
 from src.agent import config
 from src.agent.adapters import agent_tools, database, llm, rag
 from src.agent.domain import commands, model
+from src.agent.observability.sampling import is_trace_sampled, observe_sampled
 from src.agent.utils.constants import TraceNames
 
 
@@ -67,9 +68,8 @@ class AbstractAdapter(ABC):
         Returns:
             An iterator of events.
         """
-        while self.agent.events:
-            event = self.agent.events.pop(0)
-            yield event
+        events, self.agent.events = self.agent.events, []
+        yield from events
 
 
 class RouterAdapter(AbstractAdapter):
@@ -111,12 +111,10 @@ class RouterAdapter(AbstractAdapter):
         self.scenario_adapter.add(agent)
 
     def collect_new_events(self):
-        """Collect events from both adapters."""
-        events = []
-        events.extend(self.agent_adapter.collect_new_events())
-        events.extend(self.sql_adapter.collect_new_events())
-        events.extend(self.scenario_adapter.collect_new_events())
-        return events
+        """Collect events from all adapters."""
+        yield from self.agent_adapter.collect_new_events()
+        yield from self.sql_adapter.collect_new_events()
+        yield from self.scenario_adapter.collect_new_events()
 
 
 class AgentAdapter(AbstractAdapter):
@@ -229,7 +227,7 @@ class AgentAdapter(AbstractAdapter):
                 )
         return response
 
-    @observe()
+    @observe_sampled()
     def check(self, command: commands.Check) -> commands.Check:
         """
         Check the incoming question via guardrails.
@@ -240,12 +238,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Check: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="check",
+                session_id=command.q_id,
+            )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -256,7 +253,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def enhance(self, command: commands.Enhance):
         """
         Enhance the question via LLM based on the reranked document.
@@ -267,12 +264,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Enhance: The command to enhance the question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name=TraceNames.ENHANCE,
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name=TraceNames.ENHANCE,
+                session_id=command.q_id,
+            )
 
         response = self.llm.use(command.question, commands.LLMResponseModel)
 
@@ -281,7 +277,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def evaluate(self, command: commands.FinalCheck) -> commands.FinalCheck:
         """
         Evaluate the response via guardrails.
@@ -292,12 +288,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.FinalCheck: The command to evaluate.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="evaluation",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="evaluation",
+                session_id=command.q_id,
+            )
         response = self.guardrails.use(
             command.question, commands.GuardrailPostCheckModel
         )
@@ -313,7 +308,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def finalize(self, command: commands.LLMResponse) -> commands.LLMResponse:
         """
         Finalize the response via LLM.
@@ -324,12 +319,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.LLMResponse: The command to finalize the response.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name=TraceNames.FINALIZE,
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name=TraceNames.FINALIZE,
+                session_id=command.q_id,
+            )
 
         response = self.llm.use(command.question, commands.LLMResponseModel)
 
@@ -338,7 +332,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def question(self, command: commands.Question) -> commands.Question:
         """
         Only for tracing.
@@ -349,16 +343,15 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="question",
+                session_id=command.q_id,
+            )
 
         return command
 
-    @observe()
+    @observe_sampled()
     def rerank(self, command: commands.Rerank):
         """
         Rerank the documents from the knowledge base.
@@ -394,7 +387,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def retrieve(self, command: commands.Retrieve):
         """
         Retrieve the most relevant documents from the knowledge base.
@@ -405,12 +398,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Retrieve: The command to retrieve the most relevant documents.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="retrieve",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="retrieve",
+                session_id=command.q_id,
+            )
         candidates = []
         response = self.rag.embed(command.question)
 
@@ -423,7 +415,7 @@ class AgentAdapter(AbstractAdapter):
         command.candidates = candidates
         return command
 
-    @observe()
+    @observe_sampled()
     def use(self, command: commands.UseTools) -> commands.UseTools:
         """
         Use the agent tools to process the question.
@@ -434,12 +426,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.UseTools: The command to use the agent tools.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="use",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="use",
+                session_id=command.q_id,
+            )
         response, memory = self.tools.use(command.question)
 
         command.memory = memory
@@ -459,7 +450,7 @@ class AgentAdapter(AbstractAdapter):
         return command
 
     # Async versions of all methods
-    @observe()
+    @observe_sampled()
     async def check_async(self, command: commands.Check) -> commands.Check:
         """
         Check the incoming question via guardrails (async).
@@ -470,12 +461,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Check: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="check_async",
+                session_id=command.q_id,
+            )
         response = await self.guardrails.use_async(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -486,7 +476,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     async def enhance_async(self, command: commands.Enhance):
         """
         Enhance the question via LLM based on the reranked document (async).
@@ -497,12 +487,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Enhance: The command to enhance the question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name=TraceNames.ENHANCE + "_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name=TraceNames.ENHANCE + "_async",
+                session_id=command.q_id,
+            )
 
         response = await self.llm.use_async(command.question, commands.LLMResponseModel)
 
@@ -511,7 +500,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     async def evaluate_async(self, command: commands.FinalCheck) -> commands.FinalCheck:
         """
         Evaluate the response via guardrails (async).
@@ -522,12 +511,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.FinalCheck: The command to evaluate.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="evaluation_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="evaluation_async",
+                session_id=command.q_id,
+            )
         response = await self.guardrails.use_async(
             command.question, commands.GuardrailPostCheckModel
         )
@@ -543,7 +531,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     async def finalize_async(
         self, command: commands.LLMResponse
     ) -> commands.LLMResponse:
@@ -556,12 +544,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.LLMResponse: The command to finalize the response.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name=TraceNames.FINALIZE + "_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name=TraceNames.FINALIZE + "_async",
+                session_id=command.q_id,
+            )
 
         response = await self.llm.use_async(command.question, commands.LLMResponseModel)
 
@@ -570,7 +557,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     async def rerank_async(self, command: commands.Rerank):
         """
         Rerank the documents from the knowledge base (async).
@@ -613,7 +600,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     async def retrieve_async(self, command: commands.Retrieve):
         """
         Retrieve the most relevant documents from the knowledge base (async).
@@ -624,12 +611,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Retrieve: The command to retrieve the most relevant documents.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="retrieve_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="retrieve_async",
+                session_id=command.q_id,
+            )
         candidates = []
         response = await self.rag.embed_async(command.question)
 
@@ -642,7 +628,7 @@ class AgentAdapter(AbstractAdapter):
         command.candidates = candidates
         return command
 
-    @observe()
+    @observe_sampled()
     async def use_async(self, command: commands.UseTools) -> commands.UseTools:
         """
         Use the agent tools to process the question (async).
@@ -653,12 +639,11 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.UseTools: The command to use the agent tools.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="use_async",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="use_async",
+                session_id=command.q_id,
+            )
         # Use thread wrapper since tools don't have async method yet
         response, memory = await asyncio.to_thread(self.tools.use, command.question)
 
@@ -722,7 +707,7 @@ class SQLAgentAdapter(AbstractAdapter):
         )
         self.rag = rag.BaseRAG(config.get_rag_config())
 
-    @observe()
+    @observe_sampled()
     def aggregation(self, command: commands.SQLAggregation) -> commands.SQLAggregation:
         """
         Aggregate the question to schema elements.
@@ -733,12 +718,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLAggregation: The command to aggregation.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="aggregation",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="aggregation",
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.AggregationResponse)
 
         command.aggregations = response.aggregations
@@ -748,7 +732,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def check(self, command: commands.Check) -> commands.Check:
         """
         Check the incoming question via guardrails.
@@ -759,12 +743,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.Check: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="check",
+                session_id=command.q_id,
+            )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -775,7 +758,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def construction(
         self, command: commands.SQLConstruction
     ) -> commands.SQLConstruction:
@@ -788,12 +771,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLConstruction: The command to construction.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="construction",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="construction",
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.ConstructionResponse)
 
         command.sql_query = response.sql_query
@@ -876,7 +858,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return new_schema
 
-    @observe()
+    @observe_sampled()
     def filter(self, command: commands.SQLFilter) -> commands.SQLFilter:
         """
         Validate the question to schema elements.
@@ -887,12 +869,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLValidation: The command to validation.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="validation",
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.FilterResponse)
 
         command.chain_of_thought = response.chain_of_thought
@@ -900,7 +881,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def grounding(self, command: commands.SQLGrounding) -> commands.SQLGrounding:
         """
         Ground the question to schema elements.
@@ -911,12 +892,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLGrounding: The command to ground.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="grounding",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="grounding",
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.GroundingResponse)
 
         command.table_mapping = response.table_mapping
@@ -925,7 +905,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def join_inference(
         self, command: commands.SQLJoinInference
     ) -> commands.SQLJoinInference:
@@ -938,12 +918,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLJoinInference: The command to join inference.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="grounding",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="grounding",
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.JoinInferenceResponse)
 
         command.joins = response.joins
@@ -1021,7 +1000,7 @@ class SQLAgentAdapter(AbstractAdapter):
                 )
         return response
 
-    @observe()
+    @observe_sampled()
     def question(self, command: commands.Question) -> commands.Question:
         """
         Gets the schema info from the database.
@@ -1032,12 +1011,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="question",
+                session_id=command.q_id,
+            )
 
         try:
             # Use context manager with improved error handling
@@ -1059,17 +1037,16 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def sql_execution(self, command: commands.SQLExecution) -> commands.SQLExecution:
         """
         Execute the SQL query.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="sql_execution",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="sql_execution",
+                session_id=command.q_id,
+            )
 
         try:
             # Use context manager with improved error handling
@@ -1086,7 +1063,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def validation(self, command: commands.SQLValidation) -> commands.SQLValidation:
         """
         Ground the question to schema elements.
@@ -1097,12 +1074,11 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLFilter: The command to filter.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="validation",
+                session_id=command.q_id,
+            )
 
         response = self.llm.use(command.question, commands.ValidationResponse)
 
@@ -1172,7 +1148,7 @@ class ScenarioAdapter(AbstractAdapter):
             kwargs=config.get_llm_config(),
         )
 
-    @observe()
+    @observe_sampled()
     def check(self, command: commands.Scenario) -> commands.Scenario:
         """
         Check the incoming question via guardrails.
@@ -1183,12 +1159,11 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.Scenario: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="check",
+                session_id=command.q_id,
+            )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -1198,7 +1173,7 @@ class ScenarioAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def finalize(
         self, command: commands.ScenarioLLMResponse
     ) -> commands.ScenarioLLMResponse:
@@ -1212,12 +1187,11 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.ScenarioLLMResponse: The command to finalize.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name=TraceNames.FINALIZE,
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name=TraceNames.FINALIZE,
+                session_id=command.q_id,
+            )
         response = self.llm.use(command.question, commands.ScenarioResponse)
 
         command.chain_of_thought = response.chain_of_thought
@@ -1350,7 +1324,7 @@ class ScenarioAdapter(AbstractAdapter):
                 )
         return response
 
-    @observe()
+    @observe_sampled()
     def question(self, command: commands.Question) -> commands.Question:
         """
         Gets the schema info from the database.
@@ -1361,12 +1335,11 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="question",
+                session_id=command.q_id,
+            )
 
         try:
             # Use context manager with improved error handling
@@ -1388,7 +1361,7 @@ class ScenarioAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe_sampled()
     def validation(
         self, command: commands.ScenarioFinalCheck
     ) -> commands.ScenarioFinalCheck:
@@ -1401,12 +1374,11 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.ScenarioFinalCheck: The command to validate.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="validation",
+                session_id=command.q_id,
+            )
 
         response = self.llm.use(command.question, commands.ScenarioValidationResponse)
 
@@ -1,4 +1,3 @@
-import os
 from abc import ABC
 from datetime import datetime
 from typing import Dict, List, Tuple
@@ -16,6 +15,7 @@ from smolagents import (
     TaskStep,
 )
 from src.agent.observability.context import ctx_query_id
+from src.agent.observability.sampling import is_telemetry_enabled, is_trace_sampled
 
 
 class AbstractTools(ABC):
@@ -166,7 +166,7 @@ class Tools(AbstractTools):
             response: str: The response from the agent's tools.
             memory: List[str]: The agent's memory for each step.
         """
-        if os.getenv("TELEMETRY_ENABLED", None) == "true":
+        if is_telemetry_enabled() and is_trace_sampled():
             response = self._use_with_telemetry(question)
         else:
             response = self._use(question)
@@ -1,4 +1,5 @@
 import asyncio
+import random
 import re
 from abc import ABC
 from typing import Any, AsyncIterator, Dict, List, Optional
@@ -682,47 +683,51 @@ class BaseDatabaseAdapter(AbstractDatabase):
             DatabaseConnectionException: If connection fails after all retries.
         """
         if self.engine is None:
+            max_retries = self.max_retries
             retry_count = 0
-            last_exception = None
 
-            while retry_count <= self.max_retries:
+            while retry_count <= max_retries:
                 try:
                     self.engine = await self._create_async_engine()
                     await self._test_connection()
                     logger.info(f"Connected to {self.db_type} database")
                     return
                 except Exception as e:
-                    last_exception = e
                     retry_count += 1
 
-                    if retry_count <= self.max_retries:
-                        # Calculate exponential backoff delay
-                        delay = min(
-                            self.base_delay * (2 ** (retry_count - 1)), self.max_delay
-                        )
-                        logger.warning(
-                            f"Database connection failed (attempt {retry_count}/{self.max_retries + 1}): {e}. "
-                            f"Retrying in {delay:.1f} seconds..."
-                        )
-                        await asyncio.sleep(delay)
-                    else:
+                    if retry_count > max_retries:
                         logger.error(
-                            f"Failed to connect to database after {self.max_retries + 1} attempts"
+                            f"Failed to connect to database after {max_retries + 1} attempts"
                         )
 
                         context = {
                             "connection_string": self.connection_string,
                             "db_type": self.db_type,
                             "retry_count": retry_count,
-                            "max_retries": self.max_retries,
+                            "max_retries": max_retries,
                             "operation": "connect",
                         }
                         raise DatabaseConnectionException(
-                            f"Failed to connect to database after {retry_count} attempts: {last_exception}",
+                            f"Failed to connect to database after {retry_count} attempts: {e}",
                             context=context,
-                            original_exception=last_exception,
+                            original_exception=e,
                         )
 
+                    # Exponential backoff with full jitter below the cap
+                    delay = random.uniform(
+                        0,
+                        min(self.base_delay * (2 ** (retry_count - 1)), self.max_delay),
+                    )
+                    logger.warning(
+                        "Database connection failed (attempt {attempt}/{attempts}): {error}. "
+                        "Retrying in {delay:.1f} seconds...",
+                        attempt=retry_count,
+                        attempts=max_retries + 1,
+                        error=str(e),
+                        delay=delay,
+                    )
+                    await asyncio.sleep(delay)
+
     async def disconnect(self) -> None:
         """
         Disconnect from the database and dispose of the engine.
@@ -1,15 +1,18 @@
 import asyncio
+import contextvars
+import random
 from abc import ABC
 from typing import Any, Dict, Optional
 
 import instructor
-from langfuse import get_client, observe
+from langfuse import get_client
 from litellm import completion, acompletion
 from loguru import logger
 from pydantic import BaseModel
 
 from src.agent.exceptions import LLMAPIException
 from src.agent.observability.context import ctx_query_id
+from src.agent.observability.sampling import is_trace_sampled, observe_sampled
 from src.agent.adapters.cache import CacheManager, CacheStrategy, get_ttl_for_strategy
 
 
@@ -153,7 +156,7 @@ class LLM(AbstractLLM):
         client = instructor.from_litellm(acompletion)
         return client
 
-    @observe(as_type="generation")
+    @observe_sampled(as_type="generation")
     def use(self, question: str, response_model: BaseModel) -> BaseModel:
         """
         Synchronous wrapper for backward compatibility.
@@ -188,8 +191,10 @@ class LLM(AbstractLLM):
                         new_loop.close()
                         asyncio.set_event_loop(None)
 
+                # Carry the request context (q_id, sampling decision) into the thread
+                context = contextvars.copy_context()
                 with concurrent.futures.ThreadPoolExecutor() as executor:
-                    return executor.submit(run_in_thread).result()
+                    return executor.submit(context.run, run_in_thread).result()
             else:
                 return loop.run_until_complete(_run_llm_call())
         except RuntimeError:
@@ -210,7 +215,7 @@ class LLM(AbstractLLM):
                 loop.close()
                 asyncio.set_event_loop(None)
 
-    @observe(as_type="generation")
+    @observe_sampled(as_type="generation")
     async def use_async(self, question: str, response_model: BaseModel) -> BaseModel:
         """
         Calls the LLM model asynchronously with retry logic and timeout handling.
@@ -230,19 +235,19 @@ class LLM(AbstractLLM):
             {"role": "user", "content": question},
         ]
 
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="llm_call",
-            input=messages.copy(),
-            metadata={"temperature": self.temperature, "model": self.model_id},
-            session_id=ctx_query_id.get(),
-        )
+        if is_trace_sampled():
+            get_client().update_current_trace(
+                name="llm_call",
+                input=messages.copy(),
+                metadata={"temperature": self.temperature, "model": self.model_id},
+                session_id=ctx_query_id.get(),
+            )
 
+        max_retries = self.max_retries
         retry_count = 0
         last_exception = None
 
-        while retry_count <= self.max_retries:
+        while retry_count <= max_retries:
             try:
                 # Execute LLM call with timeout
                 response = await asyncio.wait_for(
@@ -250,34 +255,33 @@ class LLM(AbstractLLM):
                     timeout=self.timeout,
                 )
 
-                logger.debug(f"LLM call successful after {retry_count} retries")
+                logger.debug(
+                    "LLM call successful after {retry_count} retries",
+                    retry_count=retry_count,
+                )
                 return response
 
-            except asyncio.TimeoutError as e:
-                last_exception = e
-                retry_count += 1
-
-                if retry_count <= self.max_retries:
-                    delay = min(
-                        self.base_delay * (2 ** (retry_count - 1)), self.max_delay
-                    )
-                    logger.warning(
-                        f"LLM call timeout (attempt {retry_count}/{self.max_retries + 1}): {e}. "
-                        f"Retrying in {delay:.1f} seconds..."
-                    )
-                    await asyncio.sleep(delay)
-
             except Exception as e:
                 last_exception = e
                 retry_count += 1
 
-                if retry_count <= self.max_retries:
-                    delay = min(
-                        self.base_delay * (2 ** (retry_count - 1)), self.max_delay
+                if retry_count <= max_retries:
+                    outcome = (
+                        "timeout" if isinstance(e, asyncio.TimeoutError) else "failed"
+                    )
+                    # Full jitter: sample uniformly below the capped backoff
+                    delay = random.uniform(
+                        0,
+                        min(self.base_delay * (2 ** (retry_count - 1)), self.max_delay),
                     )
                     logger.warning(
-                        f"LLM call failed (attempt {retry_count}/{self.max_retries + 1}): {e}. "
-                        f"Retrying in {delay:.1f} seconds..."
+                        "LLM call {outcome} (attempt {attempt}/{attempts}): {error}. "
+                        "Retrying in {delay:.1f} seconds...",
+                        outcome=outcome,
+                        attempt=retry_count,
+                        attempts=max_retries + 1,
+                        error=str(e),
+                        delay=delay,
                     )
                     await asyncio.sleep(delay)
 
@@ -288,7 +292,7 @@ class LLM(AbstractLLM):
             "temperature": self.temperature,
             "timeout_seconds": self.timeout,
             "retry_count": retry_count,
-            "max_retries": self.max_retries,
+            "max_retries": max_retries,
             "messages": messages,
             "operation": "llm_call",
         }
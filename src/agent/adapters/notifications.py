@@ -3,6 +3,7 @@ import smtplib
 import time
 from abc import ABC, abstractmethod
 from email.message import EmailMessage
+from typing import List, Tuple
 
 import httpx
 from fastapi import WebSocket
@@ -20,12 +21,41 @@ class AbstractNotifications(ABC):
 
     Methods:
         - send(self, destination: str, message: str) -> None: Send a notification.
+        - send_batch(self, items: List[Tuple[str, Event]]) -> None: Send several notifications.
+        - send_batch_async(self, items: List[Tuple[str, Event]]) -> None: Send several notifications from async code.
     """
 
+    # Notifiers doing blocking I/O in send are moved off the event loop
+    blocking_send: bool = False
+
     @abstractmethod
     def send(self, destination: str, event: events.Event) -> None:
         raise NotImplementedError
 
+    def send_batch(self, items: List[Tuple[str, events.Event]]) -> None:
+        """
+        Send several notifications in order.
+
+        Args:
+            items: List[Tuple[str, events.Event]]: (destination, event) pairs to send.
+        """
+        for destination, event in items:
+            self.send(destination, event)
+
+    async def send_batch_async(self, items: List[Tuple[str, events.Event]]) -> None:
+        """
+        Send several notifications without blocking the event loop.
+
+        Blocking notifiers run the whole batch in one worker thread hop.
+
+        Args:
+            items: List[Tuple[str, events.Event]]: (destination, event) pairs to send.
+        """
+        if self.blocking_send:
+            await asyncio.to_thread(self.send_batch, items)
+        else:
+            self.send_batch(items)
+
 
 class CliNotifications(AbstractNotifications):
     """
@@ -54,6 +84,8 @@ class SlackNotifications(AbstractNotifications):
         - send(self, destination: str, message: str) -> None: Send a notification.
     """
 
+    blocking_send = True
+
     def __init__(self):
         self.config = get_slack_config()
 
@@ -80,6 +112,8 @@ class EmailNotifications(AbstractNotifications):
         - send(self, destination: str, message: str) -> None: Send a notification.
     """
 
+    blocking_send = True
+
     def __init__(self):
         self.config = get_email_config()
 
@@ -99,6 +133,8 @@ class EmailNotifications(AbstractNotifications):
 
 
 class WSNotifications(AbstractNotifications):
+    blocking_send = True
+
     def send(self, destination: str, event: events.Event) -> None:
         client_info = connected_clients.get(destination)
         if client_info:
@@ -143,6 +179,8 @@ class WSNotifications(AbstractNotifications):
 
 
 class SSENotifications(AbstractNotifications):
+    blocking_send = True
+
     def send(self, destination: str, event: events.Event) -> None:
         client_info = connected_clients.get(destination)
         if client_info:
@@ -173,8 +173,4 @@ def inject_dependencies(handler, dependencies):
         name: dependency for name, dependency in dependencies.items() if name in params
     }
 
-    # Check if the handler is async
-    if inspect.iscoroutinefunction(handler):
-        return lambda message: handler(message, **deps)
-    else:
-        return lambda message: handler(message, **deps)
+    return lambda message: handler(message, **deps)
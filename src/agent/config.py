@@ -1,7 +1,14 @@
 from os import getenv
 from pathlib import Path
 
-from src.agent.utils.constants import EnvVars, ErrorMessages, Database, URLs, Cache
+from src.agent.utils.constants import (
+    Cache,
+    Database,
+    EnvVars,
+    ErrorMessages,
+    Tracing,
+    URLs,
+)
 
 ROOTDIR: str = str(Path(__file__).resolve().parents[2])
 
@@ -128,6 +135,25 @@ def get_tracing_config():
     telemetry_enabled = getenv(
         EnvVars.TELEMETRY_ENABLED, Database.DEFAULT_TELEMETRY_ENABLED
     )
+    bsp_max_queue_size = int(
+        getenv(EnvVars.OTEL_BSP_MAX_QUEUE_SIZE, Tracing.DEFAULT_BSP_MAX_QUEUE_SIZE)
+    )
+    bsp_schedule_delay_millis = int(
+        getenv(
+            EnvVars.OTEL_BSP_SCHEDULE_DELAY, Tracing.DEFAULT_BSP_SCHEDULE_DELAY_MILLIS
+        )
+    )
+    bsp_max_export_batch_size = int(
+        getenv(
+            EnvVars.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+            Tracing.DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE,
+        )
+    )
+    bsp_export_timeout_millis = int(
+        getenv(
+            EnvVars.OTEL_BSP_EXPORT_TIMEOUT, Tracing.DEFAULT_BSP_EXPORT_TIMEOUT_MILLIS
+        )
+    )
 
     if langfuse_public_key is None:
         raise ValueError(ErrorMessages.LANGFUSE_PUBLIC_KEY_NOT_SET)
@@ -148,6 +174,10 @@ def get_tracing_config():
         langfuse_secret_key=langfuse_secret_key,
         otel_exporter_otlp_endpoint=otel_exporter_otlp_endpoint,
         telemetry_enabled=telemetry_enabled,
+        bsp_max_queue_size=bsp_max_queue_size,
+        bsp_schedule_delay_millis=bsp_schedule_delay_millis,
+        bsp_max_export_batch_size=bsp_max_export_batch_size,
+        bsp_export_timeout_millis=bsp_export_timeout_millis,
     )
 
 
@@ -187,8 +217,8 @@ def get_database_config():
     db_port = getenv(EnvVars.PG_PORT)
     db_name = getenv(EnvVars.PG_NAME)
 
-    database_connection_string = Database.CONNECTION_STRING_TEMPLATE.format(
-        user=db_user, password=db_password, host=db_host, port=db_port, name=db_name
+    database_connection_string = Database.build_connection_string(
+        db_user, db_password, db_host, db_port, db_name
     )
     database_type = getenv(EnvVars.DATABASE_TYPE, Database.DEFAULT_DATABASE_TYPE)
 
@@ -209,8 +239,8 @@ def get_evaluation_database_config():
     db_port = getenv(EnvVars.PG_PORT)
     db_name = getenv(EnvVars.PG_EVAL_DB, Database.DEFAULT_EVAL_DB)
 
-    evaluation_connection_string = Database.CONNECTION_STRING_TEMPLATE.format(
-        user=db_user, password=db_password, host=db_host, port=db_port, name=db_name
+    evaluation_connection_string = Database.build_connection_string(
+        db_user, db_password, db_host, db_port, db_name
     )
 
     if not all([db_user, db_password, db_host, db_port]):
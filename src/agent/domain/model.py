@@ -5,18 +5,8 @@ import yaml
 
 from src.agent.domain import commands, events
 from src.agent.utils import populate_template
-from src.agent.utils.command_registry import CommandHandlerRegistry
 from src.agent.utils.constants import PromptKeys, ErrorMessages
-from src.agent.utils.command_handlers import (
-    QuestionHandler,
-    CheckHandler,
-    RetrieveHandler,
-    RerankHandler,
-    EnhanceHandler,
-    UseToolsHandler,
-    LLMResponseHandler,
-    FinalCheckHandler,
-)
+from src.agent.utils.command_handlers import build_default_registry
 from src.agent.utils.config_manager import ConfigurationManager
 
 
@@ -76,25 +66,8 @@ class BaseAgent:
 
         self.base_prompts = self.init_prompts()
 
-        # Initialize command registry with handlers
-        self.command_registry = CommandHandlerRegistry()
-        self._register_command_handlers()
-
-    def _register_command_handlers(self) -> None:
-        """
-        Register all command handlers with the registry.
-
-        This method sets up the Strategy pattern for command processing,
-        replacing the match/case logic with a more maintainable registry.
-        """
-        self.command_registry.register(commands.Question, QuestionHandler())
-        self.command_registry.register(commands.Check, CheckHandler())
-        self.command_registry.register(commands.Retrieve, RetrieveHandler())
-        self.command_registry.register(commands.Rerank, RerankHandler())
-        self.command_registry.register(commands.Enhance, EnhanceHandler())
-        self.command_registry.register(commands.UseTools, UseToolsHandler())
-        self.command_registry.register(commands.LLMResponse, LLMResponseHandler())
-        self.command_registry.register(commands.FinalCheck, FinalCheckHandler())
+        # Initialize command registry with handlers bound to this agent
+        self.command_registry = build_default_registry(self)
 
     def _get_prompt_template(self, command: commands.Command) -> str:
         """
@@ -373,7 +373,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str = Query(...))
 
 @app.get("/sse/{session_id}")
 async def sse(request: Request, session_id: str):
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     if session_id not in connected_clients:
         connected_clients[session_id] = {
@@ -11,11 +11,16 @@ The hierarchy follows the principle of specific exceptions for specific
 error conditions, making debugging and error handling more effective.
 """
 
-import re
-from typing import Any, Dict, List, Optional, Set
+import reprlib
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from src.agent.utils.constants import Security
 
+# Caps the size of context shown in __repr__
+_CONTEXT_REPR = reprlib.Repr()
+_CONTEXT_REPR.maxdict = 3
+_CONTEXT_REPR.maxstring = 80
+
 
 class AgentException(Exception):
     """
@@ -33,8 +38,10 @@ class AgentException(Exception):
         original_exception: The original exception that caused this error (for chaining)
     """
 
+    __slots__ = ("message", "context", "original_exception")
+
     # Sensitive keys that should be filtered from context when logging
-    _SENSITIVE_KEYS: Set[str] = Security.SENSITIVE_KEYS
+    _SENSITIVE_KEYS: FrozenSet[str] = Security.SENSITIVE_KEYS
 
     # Patterns for sensitive data in string values
     _SENSITIVE_PATTERNS: List[str] = Security.SENSITIVE_PATTERNS
@@ -54,15 +61,31 @@ class AgentException(Exception):
         if original_exception:
             self.__cause__ = original_exception
 
+    def __reduce__(self):
+        """
+        Support pickling despite __slots__.
+
+        BaseException only pickles args and __dict__, which would drop the
+        slotted context and original exception (e.g. for enqueued log sinks).
+        """
+        return (type(self), (self.message, self.context, self.original_exception))
+
     def __str__(self) -> str:
         """Return the error message."""
         return self.message
 
     def __repr__(self) -> str:
-        """Return a detailed representation of the exception."""
+        """
+        Return a bounded representation of the exception.
+
+        Context is sanitized and truncated so that large values (e.g. SQL
+        strings) or secrets never end up in traceback or log output.
+        """
         class_name = self.__class__.__name__
-        context_info = f", context={self.context}" if self.context else ""
-        return f"{class_name}('{self.message}'{context_info})"
+        if not self.context:
+            return f"{class_name}({self.message!r})"
+        context_info = _CONTEXT_REPR.repr(self.get_sanitized_context())
+        return f"{class_name}({self.message!r}, context={context_info})"
 
     def get_sanitized_context(self) -> Dict[str, Any]:
         """
@@ -91,33 +114,22 @@ class AgentException(Exception):
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a key is considered sensitive."""
-        return key.lower() in self._SENSITIVE_KEYS
+        return Security.is_sensitive(key)
 
     def _contains_sensitive_data(self, value: str) -> bool:
         """Check if a string value contains sensitive patterns."""
-        for pattern in self._SENSITIVE_PATTERNS:
-            if re.search(pattern, value, re.IGNORECASE):
-                return True
-        return False
+        return Security.contains_sensitive(value)
 
     def _filter_sensitive_patterns(self, value: str) -> str:
         """Filter sensitive patterns from a string value."""
-        filtered_value = value
-        for pattern in self._SENSITIVE_PATTERNS:
-            filtered_value = re.sub(
-                pattern,
-                Security.FILTERED_PLACEHOLDER,
-                filtered_value,
-                flags=re.IGNORECASE,
-            )
-        return filtered_value
+        return Security.filter_string(value)
 
 
 # Database Exceptions
 class DatabaseException(AgentException):
     """Base class for database-related exceptions."""
 
-    pass
+    __slots__ = ()
 
 
 class DatabaseConnectionException(DatabaseException):
@@ -130,7 +142,7 @@ class DatabaseConnectionException(DatabaseException):
     - retry_count: Number of connection attempts
     """
 
-    pass
+    __slots__ = ()
 
 
 class DatabaseQueryException(DatabaseException):
@@ -144,7 +156,7 @@ class DatabaseQueryException(DatabaseException):
     - affected_rows: Number of rows affected (for DML)
     """
 
-    pass
+    __slots__ = ()
 
 
 class DatabaseTransactionException(DatabaseException):
@@ -157,14 +169,14 @@ class DatabaseTransactionException(DatabaseException):
     - rollback_attempted: Whether rollback was attempted
     """
 
-    pass
+    __slots__ = ()
 
 
 # Validation Exceptions
 class ValidationException(AgentException):
     """Base class for validation-related exceptions."""
 
-    pass
+    __slots__ = ()
 
 
 class InputValidationException(ValidationException):
@@ -178,7 +190,7 @@ class InputValidationException(ValidationException):
     - validation_rule: The validation rule that failed
     """
 
-    pass
+    __slots__ = ()
 
 
 class SQLValidationException(ValidationException):
@@ -192,14 +204,14 @@ class SQLValidationException(ValidationException):
     - column_number: Column number where error occurred
     """
 
-    pass
+    __slots__ = ()
 
 
 # Agent State Machine Exceptions
 class AgentStateException(AgentException):
     """Base class for agent state machine related exceptions."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidStateTransitionException(AgentStateException):
@@ -213,7 +225,7 @@ class InvalidStateTransitionException(AgentStateException):
     - agent_id: Unique identifier for the agent instance
     """
 
-    pass
+    __slots__ = ()
 
 
 class CommandProcessingException(AgentStateException):
@@ -227,14 +239,14 @@ class CommandProcessingException(AgentStateException):
     - agent_state: Current agent state
     """
 
-    pass
+    __slots__ = ()
 
 
 # External Service Exceptions
 class ExternalServiceException(AgentException):
     """Base class for external service related exceptions."""
 
-    pass
+    __slots__ = ()
 
 
 class LLMAPIException(ExternalServiceException):
@@ -249,7 +261,7 @@ class LLMAPIException(ExternalServiceException):
     - rate_limit_reset: When rate limit resets (if applicable)
     """
 
-    pass
+    __slots__ = ()
 
 
 class RAGSystemException(ExternalServiceException):
@@ -264,7 +276,7 @@ class RAGSystemException(ExternalServiceException):
     - documents_found: Number of documents found before failure
     """
 
-    pass
+    __slots__ = ()
 
 
 class NotificationServiceException(ExternalServiceException):
@@ -278,14 +290,14 @@ class NotificationServiceException(ExternalServiceException):
     - retry_count: Number of retry attempts
     """
 
-    pass
+    __slots__ = ()
 
 
 # Configuration Exceptions
 class ConfigurationException(AgentException):
     """Base class for configuration-related exceptions."""
 
-    pass
+    __slots__ = ()
 
 
 class MissingConfigurationException(ConfigurationException):
@@ -299,7 +311,7 @@ class MissingConfigurationException(ConfigurationException):
     - config_file: Configuration file being read
     """
 
-    pass
+    __slots__ = ()
 
 
 class InvalidConfigurationException(ConfigurationException):
@@ -314,7 +326,7 @@ class InvalidConfigurationException(ConfigurationException):
     - validation_error: Specific validation error message
     """
 
-    pass
+    __slots__ = ()
 
 
 # Export all exception classes for easy importing
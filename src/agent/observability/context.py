@@ -5,6 +5,8 @@ from typing import Dict
 from fastapi import WebSocket
 
 ctx_query_id = ContextVar("query_id", default="-")
+# Head-sampling decision for the current request; True until a handler decides
+ctx_trace_sampled = ContextVar("trace_sampled", default=True)
 
 
 connected_clients: Dict[str, WebSocket] = {}
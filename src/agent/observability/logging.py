@@ -78,6 +78,7 @@ def setup_logging(config: dict):
                     "sink": sink_serializer,
                     "level": service_log_level,
                     "filter": query_id_filter,
+                    "enqueue": True,
                 }
             ]
         )
@@ -92,6 +93,7 @@ def setup_logging(config: dict):
                     "level": service_log_level,
                     "format": fmt,
                     "filter": query_id_filter,
+                    "enqueue": True,
                 }
             ]
         )
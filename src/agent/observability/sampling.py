@@ -0,0 +1,140 @@
+import functools
+import hashlib
+import inspect
+from os import environ, getenv
+
+from langfuse import observe
+
+from src.agent.observability.context import ctx_trace_sampled
+from src.agent.utils.constants import EnvVars, Tracing
+
+
+def is_telemetry_enabled() -> bool:
+    """
+    Checks whether setup_tracing enabled telemetry for this process.
+
+    Returns:
+        bool: True if traces are exported.
+    """
+    return environ.get(EnvVars.TELEMETRY_ACTIVE) == "true"
+
+
+def is_trace_sampled() -> bool:
+    """
+    Checks the head-sampling decision of the request being handled.
+
+    Returns:
+        bool: False if the current handler's message fell outside the sample.
+    """
+    return ctx_trace_sampled.get()
+
+
+@functools.lru_cache(maxsize=1)
+def get_sample_rate() -> float:
+    """
+    Returns the configured trace sample rate, clamped to [0, 1].
+
+    The rate is parsed once per process; call get_sample_rate.cache_clear()
+    after changing the environment.
+
+    Returns:
+        float: The fraction of q_ids whose handler spans are recorded.
+    """
+    rate = float(getenv(EnvVars.LANGFUSE_SAMPLE_RATE, Tracing.DEFAULT_SAMPLE_RATE))
+    return min(max(rate, 0.0), 1.0)
+
+
+def is_in_sample(key: str, rate: float) -> bool:
+    """
+    Consistent-hash sampling decision for a key.
+
+    The same key always gets the same decision, so all handlers working on one
+    q_id are either traced together or not at all.
+
+    Args:
+        key: str: The sampling key, usually the q_id.
+        rate: float: The sample rate in [0, 1].
+
+    Returns:
+        bool: True if the key falls inside the sample.
+    """
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+
+    digest = hashlib.sha1(key.encode()).digest()
+    return int.from_bytes(digest[:4], "big") / 2**32 < rate
+
+
+def sampled_observe(rate: float = None, **observe_kwargs):
+    """
+    Head-based sampling wrapper around langfuse's observe decorator.
+
+    The first argument of the wrapped coroutine must be a command or event
+    carrying a q_id. Messages outside the sample, and all messages while
+    telemetry is disabled, call the undecorated function, so no span is created
+    for them. The decision is stored in ctx_trace_sampled for the duration of
+    the call, so adapter spans opened via observe_sampled follow it.
+
+    Args:
+        rate: float: Fixed sample rate; defaults to the configured rate.
+        observe_kwargs: Passed through to observe().
+    """
+
+    def decorator(func):
+        observed = observe(**observe_kwargs)(func)
+
+        @functools.wraps(func)
+        async def wrapper(message, *args, **kwargs):
+            if not is_telemetry_enabled():
+                return await func(message, *args, **kwargs)
+
+            sample_rate = get_sample_rate() if rate is None else rate
+            sampled = is_in_sample(str(getattr(message, "q_id", "")), sample_rate)
+            token = ctx_trace_sampled.set(sampled)
+            try:
+                if sampled:
+                    return await observed(message, *args, **kwargs)
+                return await func(message, *args, **kwargs)
+            finally:
+                ctx_trace_sampled.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_sampled(**observe_kwargs):
+    """
+    langfuse's observe decorator, skipped for requests outside the sample.
+
+    Used for spans opened below a handler (adapters, LLM calls), so that an
+    unsampled request does not leave orphan root traces behind.
+
+    Args:
+        observe_kwargs: Passed through to observe().
+    """
+
+    def decorator(func):
+        observed = observe(**observe_kwargs)(func)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if ctx_trace_sampled.get():
+                    return await observed(*args, **kwargs)
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if ctx_trace_sampled.get():
+                return observed(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
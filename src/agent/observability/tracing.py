@@ -1,20 +1,52 @@
 import base64
 import os
+from functools import lru_cache
 
 from openinference.instrumentation.smolagents import SmolagentsInstrumentor
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+from src.agent.utils.constants import EnvVars
+
+# Environment set up for tracing, removed again when telemetry is disabled
+_TRACING_ENV_VARS = (
+    "LANGFUSE_HOST",
+    "LANGFUSE_PROJECT_ID",
+    "LANGFUSE_PUBLIC_KEY",
+    "LANGFUSE_SECRET_KEY",
+    "OTEL_EXPORTER_OTLP_ENDPOINT",
+    "OTEL_EXPORTER_OTLP_HEADERS",
+)
+
+
+@lru_cache(maxsize=None)
+def _langfuse_auth(public_key: str, secret_key: str) -> str:
+    return base64.b64encode(f"{public_key}:{secret_key}".encode()).decode()
+
+
+@lru_cache(maxsize=1)
+def _span_exporter(endpoint: str, auth: str) -> OTLPSpanExporter:
+    """
+    Returns the long-lived OTLP exporter for the given endpoint and credentials.
+
+    Headers are passed directly, so the exporter does not parse them from
+    OTEL_EXPORTER_OTLP_HEADERS, and its HTTP session is reused across flushes.
+    """
+    return OTLPSpanExporter(
+        endpoint=f"{endpoint.rstrip('/')}/v1/traces",
+        headers={"Authorization": f"Basic {auth}"},
+    )
 
 
 def setup_tracing(config: dict):
     telemetry_enabled = config.get("telemetry_enabled", "False")
-    os.environ["TELEMETRY_ENABLED"] = telemetry_enabled
+    os.environ[EnvVars.TELEMETRY_ACTIVE] = telemetry_enabled
 
     if telemetry_enabled == "true":
-        LANGFUSE_AUTH = base64.b64encode(
-            f"{config['langfuse_public_key']}:{config['langfuse_secret_key']}".encode()
-        ).decode()
+        LANGFUSE_AUTH = _langfuse_auth(
+            config["langfuse_public_key"], config["langfuse_secret_key"]
+        )
 
         os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = config[
             "otel_exporter_otlp_endpoint"
@@ -29,19 +61,17 @@ def setup_tracing(config: dict):
         os.environ["LANGFUSE_SECRET_KEY"] = config["langfuse_secret_key"]
 
         trace_provider = TracerProvider()
-        trace_provider.add_span_processor(SimpleSpanProcessor(OTLPSpanExporter()))
+        trace_provider.add_span_processor(
+            BatchSpanProcessor(
+                _span_exporter(config["otel_exporter_otlp_endpoint"], LANGFUSE_AUTH),
+                max_queue_size=config.get("bsp_max_queue_size"),
+                schedule_delay_millis=config.get("bsp_schedule_delay_millis"),
+                max_export_batch_size=config.get("bsp_max_export_batch_size"),
+                export_timeout_millis=config.get("bsp_export_timeout_millis"),
+            )
+        )
         SmolagentsInstrumentor().instrument(tracer_provider=trace_provider)
 
     else:
-        if "LANGFUSE_HOST" in os.environ:
-            del os.environ["LANGFUSE_HOST"]
-        if "LANGFUSE_PROJECT_ID" in os.environ:
-            del os.environ["LANGFUSE_PROJECT_ID"]
-        if "LANGFUSE_PUBLIC_KEY" in os.environ:
-            del os.environ["LANGFUSE_PUBLIC_KEY"]
-        if "LANGFUSE_SECRET_KEY" in os.environ:
-            del os.environ["LANGFUSE_SECRET_KEY"]
-        if "OTEL_EXPORTER_OTLP_ENDPOINT" in os.environ:
-            del os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"]
-        if "OTEL_EXPORTER_OTLP_HEADERS" in os.environ:
-            del os.environ["OTEL_EXPORTER_OTLP_HEADERS"]
+        for key in _TRACING_ENV_VARS:
+            os.environ.pop(key, None)
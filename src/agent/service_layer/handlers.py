@@ -1,12 +1,18 @@
-from typing import Union
+import asyncio
+from typing import Callable, List, Tuple, Union
 
-from langfuse import get_client, observe
+from langfuse import get_client
 from loguru import logger
 
 from src.agent import config
 from src.agent.adapters.adapter import AbstractAdapter
 from src.agent.adapters.notifications import AbstractNotifications
 from src.agent.domain import commands, events, model, scenario_model, sql_model
+from src.agent.observability.sampling import (
+    is_telemetry_enabled,
+    is_trace_sampled,
+    sampled_observe,
+)
 from src.agent.utils.constants import ErrorMessages, StatusMessages, TraceNames
 
 
@@ -14,195 +20,236 @@ class InvalidQuestion(Exception):
     pass
 
 
-@observe()
-async def answer(
-    command: commands.Question,
-    adapter: AbstractAdapter,
-    notifications: AbstractNotifications = None,
-) -> None:
-    """
-    Handles incoming questions.
+# Notifications sent concurrently before yielding to the event loop
+NOTIFICATION_BATCH_SIZE = 50
 
-    Args:
-        command: commands.Question: The question to answer.
-        adapter: AbstractAdapter: The adapter to use.
-        notifications: AbstractNotifications: The notifications to use for real-time updates.
+_langfuse = None
 
-    Returns:
-        None
-    """
-    langfuse = get_client()
 
-    langfuse.update_current_trace(
-        name=TraceNames.ANSWER_HANDLER,
-        session_id=command.q_id,
-    )
+def _get_langfuse():
+    """
+    Returns the process-wide Langfuse client, creating it on first use.
 
-    if not command or not command.question:
-        raise InvalidQuestion(ErrorMessages.NO_QUESTION_ASKED)
+    The client is resolved lazily so that it picks up the environment set by
+    setup_tracing, which runs after this module is imported.
+    """
+    global _langfuse
+    if _langfuse is None:
+        _langfuse = get_client()
+    return _langfuse
 
-    agent = model.BaseAgent(command, config.get_agent_config())
-    adapter.add(agent)
 
-    # adapter for execution and agent for internal logic
-    while not agent.is_answered and command is not None:
-        # Send real-time status update
-        if type(command) in STEP_NAMES and notifications:
-            status_event = events.StatusUpdate(
-                step_name=STEP_NAMES[type(command)], q_id=agent.q_id
-            )
-            # Send immediately to WebSocket clients
-            for notification in notifications:
-                notification.send(agent.q_id, status_event)
-
-        logger.info(f"Calling Adapter with command: {type(command)}")
-        updated_command = await adapter.answer_async(command)
-        command = agent.update(updated_command)
+def _update_trace(name: str, session_id: str) -> None:
+    """
+    Updates the current Langfuse trace.
 
-        if agent.send_response:
-            event = agent.send_response
+    Skipped entirely when telemetry is off or the message is outside the
+    sample, since no span is active in either case.
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
+    Args:
+        name: str: The trace name.
+        session_id: str: The session id to attach to the trace.
+    """
+    if not is_telemetry_enabled() or not is_trace_sampled():
+        return
 
-            agent.send_response = None
+    _get_langfuse().update_current_trace(name=name, session_id=session_id)
 
-        if agent.evaluation:
-            event = agent.evaluation
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
+async def _notify(
+    notifications: List[AbstractNotifications], destination: str, event: events.Event
+) -> None:
+    """
+    Sends a single event to all notifications.
 
-    end_event = events.EndOfEvent(q_id=agent.q_id)
+    Args:
+        notifications: List[AbstractNotifications]: The notifications to use.
+        destination: str: The destination to send the event to.
+        event: events.Event: The event to send.
+    """
+    await _notify_batch(notifications, [(destination, event)])
 
-    for notification in notifications:
-        notification.send(end_event.q_id, end_event)
 
-    return None
+async def _notify_batch(
+    notifications: List[AbstractNotifications],
+    items: List[Tuple[str, events.Event]],
+) -> None:
+    """
+    Sends a batch of events to all notifications concurrently.
 
+    Each notification receives the whole batch in one call, in order.
+    Notifications are fanned out in groups of NOTIFICATION_BATCH_SIZE, yielding
+    to the event loop between groups so that a large fanout cannot starve it.
+    A failing notification is logged and does not affect the others.
 
-@observe()
-async def query(
-    command: commands.SQLQuestion,
+    Args:
+        notifications: List[AbstractNotifications]: The notifications to use.
+        items: List[Tuple[str, events.Event]]: (destination, event) pairs to send.
+    """
+    if not notifications or not items:
+        return
+
+    for start in range(0, len(notifications), NOTIFICATION_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+
+        batch = notifications[start : start + NOTIFICATION_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(notification.send_batch_async(items) for notification in batch),
+            return_exceptions=True,
+        )
+        for notification, result in zip(batch, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error sending notifications via "
+                    f"{type(notification).__name__}: {result}"
+                )
+
+
+async def _run_agent(
+    command: commands.Command,
     adapter: AbstractAdapter,
-    notifications: AbstractNotifications = None,
+    notifications: AbstractNotifications,
+    *,
+    agent_cls: type,
+    adapter_method_name: str,
+    trace_name: str,
 ) -> None:
     """
-    Handles incoming questions.
+    Runs an agent state machine until the question is answered.
+
+    Shared loop behind the answer, query and scenario handlers.
 
     Args:
-        command: commands.Question: The question to answer.
+        command: commands.Command: The initial question command.
         adapter: AbstractAdapter: The adapter to use.
         notifications: AbstractNotifications: The notifications to use for real-time updates.
+        agent_cls: type: The agent class driving the state machine.
+        adapter_method_name: str: The adapter coroutine executing each command.
+        trace_name: str: The trace name reported to Langfuse.
 
     Returns:
         None
     """
-    langfuse = get_client()
+    _update_trace(name=trace_name, session_id=command.q_id)
 
-    langfuse.update_current_trace(
-        name=TraceNames.QUERY_HANDLER,
-        session_id=command.q_id,
-    )
     if not command or not command.question:
         raise InvalidQuestion(ErrorMessages.NO_QUESTION_ASKED)
 
-    agent = sql_model.SQLBaseAgent(command, config.get_agent_config())
+    agent = agent_cls(command, config.get_agent_config())
     adapter.add(agent)
+    execute = getattr(adapter, adapter_method_name)
+    # Without notifications no events need to be built at all
+    notify = bool(notifications)
 
     # adapter for execution and agent for internal logic
     while not agent.is_answered and command is not None:
+        command_type = type(command)
+
         # Send real-time status update
-        if type(command) in STEP_NAMES and notifications:
-            status_event = events.StatusUpdate(
-                step_name=STEP_NAMES[type(command)], q_id=agent.q_id
-            )
-            # Send immediately to WebSocket clients
-            for notification in notifications:
-                notification.send(agent.q_id, status_event)
-
-        logger.info(f"Calling Adapter with command: {type(command)}")
-        updated_command = await adapter.query_async(command)
-        command = agent.update(updated_command)
+        make_status = STATUS_UPDATES.get(command_type) if notify else None
+        if make_status:
+            status_event = make_status(agent.q_id)
+            await _notify(notifications, agent.q_id, status_event)
 
-        if agent.send_response:
-            event = agent.send_response
+        logger.info("Calling Adapter with command: {}", command_type.__name__)
+        updated_command = await execute(command)
+        command = agent.update(updated_command)
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
+        # Events produced by this step go out as one batch
+        pending = []
 
+        if agent.send_response:
+            if notify:
+                event = agent.send_response
+                pending.append((event.q_id, event))
             agent.send_response = None
 
-        if agent.evaluation:
+        if notify and agent.evaluation:
             event = agent.evaluation
+            pending.append((event.q_id, event))
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
-
-    end_event = events.EndOfEvent(q_id=agent.q_id)
+        if pending:
+            await _notify_batch(notifications, pending)
 
-    for notification in notifications:
-        notification.send(end_event.q_id, end_event)
+    if notify:
+        end_event = events.EndOfEvent(q_id=agent.q_id)
+        await _notify(notifications, end_event.q_id, end_event)
 
     return None
 
 
-@observe()
-async def scenario(
-    command: commands.Scenario,
+@sampled_observe()
+async def answer(
+    command: commands.Question,
     adapter: AbstractAdapter,
     notifications: AbstractNotifications = None,
 ) -> None:
-    langfuse = get_client()
-
-    langfuse.update_current_trace(
-        name=TraceNames.QUERY_HANDLER,
-        session_id=command.q_id,
-    )
-    if not command or not command.question:
-        raise InvalidQuestion(ErrorMessages.NO_QUESTION_ASKED)
-
-    agent = scenario_model.ScenarioBaseAgent(command, config.get_agent_config())
-    adapter.add(agent)
-
-    # adapter for execution and agent for internal logic
-    while not agent.is_answered and command is not None:
-        # Send real-time status update
-        if type(command) in STEP_NAMES and notifications:
-            status_event = events.StatusUpdate(
-                step_name=STEP_NAMES[type(command)], q_id=agent.q_id
-            )
-            # Send immediately to WebSocket clients
-            for notification in notifications:
-                notification.send(agent.q_id, status_event)
-
-        logger.info(f"Calling Adapter with command: {type(command)}")
-        updated_command = await adapter.scenario_async(command)
-        command = agent.update(updated_command)
+    """
+    Handles incoming questions.
 
-        if agent.send_response:
-            event = agent.send_response
+    Args:
+        command: commands.Question: The question to answer.
+        adapter: AbstractAdapter: The adapter to use.
+        notifications: AbstractNotifications: The notifications to use for real-time updates.
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
+    Returns:
+        None
+    """
+    return await _run_agent(
+        command,
+        adapter,
+        notifications,
+        agent_cls=model.BaseAgent,
+        adapter_method_name="answer_async",
+        trace_name=TraceNames.ANSWER_HANDLER,
+    )
 
-            agent.send_response = None
 
-        if agent.evaluation:
-            event = agent.evaluation
+@sampled_observe()
+async def query(
+    command: commands.SQLQuestion,
+    adapter: AbstractAdapter,
+    notifications: AbstractNotifications = None,
+) -> None:
+    """
+    Handles incoming questions.
 
-            for notification in notifications:
-                notification.send(event.q_id, event)
+    Args:
+        command: commands.Question: The question to answer.
+        adapter: AbstractAdapter: The adapter to use.
+        notifications: AbstractNotifications: The notifications to use for real-time updates.
 
-    end_event = events.EndOfEvent(q_id=agent.q_id)
+    Returns:
+        None
+    """
+    return await _run_agent(
+        command,
+        adapter,
+        notifications,
+        agent_cls=sql_model.SQLBaseAgent,
+        adapter_method_name="query_async",
+        trace_name=TraceNames.QUERY_HANDLER,
+    )
 
-    for notification in notifications:
-        notification.send(end_event.q_id, end_event)
 
-    return None
+@sampled_observe()
+async def scenario(
+    command: commands.Scenario,
+    adapter: AbstractAdapter,
+    notifications: AbstractNotifications = None,
+) -> None:
+    return await _run_agent(
+        command,
+        adapter,
+        notifications,
+        agent_cls=scenario_model.ScenarioBaseAgent,
+        adapter_method_name="scenario_async",
+        trace_name=TraceNames.QUERY_HANDLER,
+    )
 
 
-@observe()
+@sampled_observe()
 async def send_response(
     event: Union[events.Response, events.Evaluation],
     notifications: AbstractNotifications,
@@ -217,19 +264,13 @@ async def send_response(
     Returns:
         None
     """
-    langfuse = get_client()
-
-    langfuse.update_current_trace(
-        name=TraceNames.SEND_RESPONSE_HANDLER,
-        session_id=event.q_id,
-    )
+    _update_trace(name=TraceNames.SEND_RESPONSE_HANDLER, session_id=event.q_id)
 
-    for notification in notifications:
-        notification.send(event.q_id, event)
+    await _notify(notifications, event.q_id, event)
     return None
 
 
-@observe()
+@sampled_observe(rate=1.0)
 async def send_failure(
     event: Union[events.RejectedAnswer, events.RejectedRequest, events.FailedRequest],
     notifications: AbstractNotifications,
@@ -244,20 +285,14 @@ async def send_failure(
     Returns:
         None
     """
-    langfuse = get_client()
+    _update_trace(name=TraceNames.SEND_REJECTED_HANDLER, session_id=event.q_id)
 
-    langfuse.update_current_trace(
-        name=TraceNames.SEND_REJECTED_HANDLER,
-        session_id=event.q_id,
-    )
-
-    for notification in notifications:
-        notification.send(event.q_id, event)
+    await _notify(notifications, event.q_id, event)
 
     return None
 
 
-@observe()
+@sampled_observe()
 async def send_status_update(
     event: events.StatusUpdate,
     notifications: AbstractNotifications,
@@ -272,15 +307,9 @@ async def send_status_update(
     Returns:
         None
     """
-    langfuse = get_client()
-
-    langfuse.update_current_trace(
-        name=TraceNames.SEND_STATUS_UPDATE_HANDLER,
-        session_id=event.q_id,
-    )
+    _update_trace(name=TraceNames.SEND_STATUS_UPDATE_HANDLER, session_id=event.q_id)
 
-    for notification in notifications:
-        notification.send(event.q_id, event)
+    await _notify(notifications, event.q_id, event)
 
     return None
 
@@ -324,3 +353,25 @@ STEP_NAMES = {
     commands.ScenarioLLMResponse: StatusMessages.THINKING,
     commands.ScenarioFinalCheck: StatusMessages.EVALUATING,
 }
+
+
+def _status_update_factory(step_name: str) -> Callable[[str], events.StatusUpdate]:
+    """
+    Builds a StatusUpdate factory for a fixed step name.
+
+    The prototype is constructed once without validation; each call only copies
+    it with the new q_id, skipping pydantic validation of a known-good shape.
+    """
+    prototype = events.StatusUpdate.model_construct(step_name=step_name, q_id="")
+
+    def make_status(q_id: str) -> events.StatusUpdate:
+        return prototype.model_copy(update={"q_id": q_id})
+
+    return make_status
+
+
+# Status update factories with the step name already bound
+STATUS_UPDATES = {
+    command_type: _status_update_factory(step_name)
+    for command_type, step_name in STEP_NAMES.items()
+}
@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from typing import Callable, Dict, List, Type, Union
 
 from loguru import logger
@@ -9,6 +10,9 @@ from src.agent.exceptions import AgentException
 
 Message = Union[commands.Command, events.Event]
 
+# Upper bound on event handlers running at the same time
+MAX_CONCURRENT_EVENT_HANDLERS = 32
+
 
 class MessageBus:
     """
@@ -36,6 +40,7 @@ class MessageBus:
         self.event_handlers = event_handlers
         self.command_handlers = command_handlers
         self.notifications = notifications
+        self._handler_slots = asyncio.Semaphore(MAX_CONCURRENT_EVENT_HANDLERS)
 
     async def handle(
         self,
@@ -50,15 +55,34 @@ class MessageBus:
         Returns:
             None
         """
-        self.queue = [message]
+        self.queue = deque([message])
+        # Drop our own reference so processed messages can be freed early
+        del message
         while self.queue:
-            message = self.queue.pop(0)
-            if isinstance(message, events.Event):
-                await self.handle_event(message)
-            elif isinstance(message, commands.Command):
-                await self.handle_command(message)
-            else:
-                raise Exception(f"{message} was not an Event or Command")
+            await self._dispatch(self.queue.popleft())
+
+    async def _dispatch(
+        self,
+        message: Message,
+    ) -> None:
+        """
+        Dispatches a single message to the event or command handling.
+
+        Keeping the message local to this call releases it as soon as it has
+        been handled, instead of holding it until the next one is dequeued.
+
+        Args:
+            message: Message: The message to dispatch.
+
+        Returns:
+            None
+        """
+        if isinstance(message, events.Event):
+            await self.handle_event(message)
+        elif isinstance(message, commands.Command):
+            await self.handle_command(message)
+        else:
+            raise Exception(f"{message} was not an Event or Command")
 
     async def handle_command(
         self,
@@ -73,13 +97,13 @@ class MessageBus:
         Args:
             command: commands.Command: The command to handle.
         """
-        logger.debug("handling command %s", command)
+        logger.opt(lazy=True).debug("handling command {}", lambda: str(command))
         try:
             handler = self.command_handlers[type(command)]
             await handler(command)
             self.queue.extend(self.adapter.collect_new_events())
         except Exception as e:
-            logger.exception("Exception handling command %s", command)
+            logger.exception("Exception handling command {}", command)
 
             # Create FailedRequest event to notify user
             # Extract question and q_id from command if available
@@ -119,14 +143,25 @@ class MessageBus:
         Returns:
             None
         """
-        # Process event handlers concurrently for better performance
-        handler_tasks = []
-        for handler in self.event_handlers[type(event)]:
-            handler_tasks.append(self._handle_single_event(handler, event))
-
-        if handler_tasks:
-            await asyncio.gather(*handler_tasks, return_exceptions=True)
-            self.queue.extend(self.adapter.collect_new_events())
+        handlers = self.event_handlers[type(event)]
+        collect = self.adapter.collect_new_events
+
+        if not handlers:
+            return
+
+        # Process event handlers concurrently; one failing handler must not
+        # cancel its siblings, so failures are collected and logged per handler
+        results = await asyncio.gather(
+            *(self._handle_single_event(handler, event) for handler in handlers),
+            return_exceptions=True,
+        )
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error(
+                    "Exception handling event {} with handler {}", event, handler
+                )
+
+        self.queue.extend(collect())
 
     async def _handle_single_event(
         self,
@@ -136,12 +171,16 @@ class MessageBus:
         """
         Handle a single event with a specific handler.
 
+        Exceptions propagate to handle_event, which logs them.
+
         Args:
             handler: Callable: The event handler function.
             event: events.Event: The event to handle.
         """
-        try:
-            logger.debug(f"handling event {str(event)} with handler {str(handler)}")
+        logger.opt(lazy=True).debug(
+            "handling event {} with handler {}",
+            lambda: str(event),
+            lambda: str(handler),
+        )
+        async with self._handler_slots:
             await handler(event)
-        except Exception:
-            logger.exception(f"Exception handling event {event}")
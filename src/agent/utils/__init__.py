@@ -7,6 +7,8 @@ the agent framework, including the command registry system.
 
 from .command_registry import CommandHandler, CommandHandlerRegistry
 from .command_handlers import (
+    PipelineStepHandler,
+    build_default_registry,
     QuestionHandler,
     CheckHandler,
     RetrieveHandler,
@@ -22,6 +24,8 @@ from .config_manager import ConfigurationManager, ConfigurationError
 __all__ = [
     "CommandHandler",
     "CommandHandlerRegistry",
+    "PipelineStepHandler",
+    "build_default_registry",
     "QuestionHandler",
     "CheckHandler",
     "RetrieveHandler",
@@ -3,131 +3,118 @@ Concrete command handler implementations.
 
 This module provides concrete implementations of the CommandHandler interface
 for each command type in the agent system, replacing the match/case logic
-with the Strategy pattern.
+with the Strategy pattern. Every pipeline step has the same shape, so a single
+data-driven PipelineStepHandler is configured from the PIPELINE_STEPS table.
 """
 
-from typing import Optional
+from typing import Callable, Optional, Tuple, Type
 
 from src.agent.domain import commands
-from src.agent.utils.command_registry import CommandHandler
+from src.agent.utils.command_registry import CommandHandler, CommandHandlerRegistry
 
 
-class QuestionHandler(CommandHandler):
-    """Handler for Question commands."""
+class PipelineStepHandler(CommandHandler):
+    """
+    Handler that forwards one command type to one ``agent.prepare_*`` step.
 
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process Question commands."""
-        return isinstance(command, commands.Question)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a Question command and return a Check command."""
-        if not isinstance(command, commands.Question):
-            return None
-
-        return agent.prepare_guardrails_check(command)
-
-
-class CheckHandler(CommandHandler):
-    """Handler for Check commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process Check commands."""
-        return isinstance(command, commands.Check)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a Check command and return a Retrieve command or RejectedRequest."""
-        if not isinstance(command, commands.Check):
-            return None
-
-        return agent.prepare_retrieval(command)
-
-
-class RetrieveHandler(CommandHandler):
-    """Handler for Retrieve commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process Retrieve commands."""
-        return isinstance(command, commands.Retrieve)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a Retrieve command and return a Rerank command."""
-        if not isinstance(command, commands.Retrieve):
-            return None
-
-        return agent.prepare_rerank(command)
-
-
-class RerankHandler(CommandHandler):
-    """Handler for Rerank commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process Rerank commands."""
-        return isinstance(command, commands.Rerank)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a Rerank command and return an Enhance command."""
-        if not isinstance(command, commands.Rerank):
-            return None
-
-        return agent.prepare_enhancement(command)
+    Once bound to an agent, the step is kept as a bound method so dispatch
+    skips the attribute lookup; for any other agent passed to ``handle`` the
+    step is resolved on that agent. Terminal steps end the chain by returning
+    None.
+    """
 
+    __slots__ = ("command_type", "step_name", "terminal", "_agent", "_next")
 
-class EnhanceHandler(CommandHandler):
-    """Handler for Enhance commands."""
+    def __init__(
+        self,
+        command_type: Type[commands.Command],
+        step_name: str,
+        terminal: bool = False,
+    ):
+        self.command_type = command_type
+        self.step_name = step_name
+        self.terminal = terminal
+        self._agent = None
+        self._next: Optional[Callable] = None
 
     def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process Enhance commands."""
-        return isinstance(command, commands.Enhance)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process an Enhance command and return a UseTools command."""
-        if not isinstance(command, commands.Enhance):
-            return None
-
-        return agent.prepare_agent_call(command)
-
+        """Check if this handler can process the given command."""
+        return isinstance(command, self.command_type)
 
-class UseToolsHandler(CommandHandler):
-    """Handler for UseTools commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process UseTools commands."""
-        return isinstance(command, commands.UseTools)
+    def bind(self, agent) -> None:
+        """Bind the agent's step method for direct calls."""
+        self._agent = agent
+        self._next = getattr(agent, self.step_name)
 
     def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a UseTools command and return an LLMResponse command."""
-        if not isinstance(command, commands.UseTools):
-            return None
-
-        return agent.prepare_finalization(command)
-
-
-class LLMResponseHandler(CommandHandler):
-    """Handler for LLMResponse commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process LLMResponse commands."""
-        return isinstance(command, commands.LLMResponse)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process an LLMResponse command and return a FinalCheck command."""
-        if not isinstance(command, commands.LLMResponse):
-            return None
-
-        return agent.prepare_response(command)
-
-
-class FinalCheckHandler(CommandHandler):
-    """Handler for FinalCheck commands."""
-
-    def can_handle(self, command: commands.Command) -> bool:
-        """Check if this handler can process FinalCheck commands."""
-        return isinstance(command, commands.FinalCheck)
-
-    def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
-        """Process a FinalCheck command and return None (end of chain)."""
-        if not isinstance(command, commands.FinalCheck):
-            return None
-
-        agent.prepare_evaluation(command)
-        return None
+        """Forward the command to the agent step and return the next command."""
+        if agent is self._agent:
+            step = self._next
+        else:
+            step = getattr(agent, self.step_name)
+        next_command = step(command)
+        return None if self.terminal else next_command
+
+
+# (command type, agent step, ends the chain) for every step of the pipeline
+PIPELINE_STEPS: Tuple[Tuple[Type[commands.Command], str, bool], ...] = (
+    (commands.Question, "prepare_guardrails_check", False),
+    (commands.Check, "prepare_retrieval", False),
+    (commands.Retrieve, "prepare_rerank", False),
+    (commands.Rerank, "prepare_enhancement", False),
+    (commands.Enhance, "prepare_agent_call", False),
+    (commands.UseTools, "prepare_finalization", False),
+    (commands.LLMResponse, "prepare_response", False),
+    (commands.FinalCheck, "prepare_evaluation", True),
+)
+
+
+def build_default_registry(agent=None) -> CommandHandlerRegistry:
+    """
+    Build a registry with a handler for every pipeline step.
+
+    Args:
+        agent: Optional agent to bind the handlers to
+
+    Returns:
+        CommandHandlerRegistry: The populated registry
+    """
+    registry = CommandHandlerRegistry()
+    for command_type, step_name, terminal in PIPELINE_STEPS:
+        registry.register(
+            command_type, PipelineStepHandler(command_type, step_name, terminal)
+        )
+    if agent is not None:
+        registry.bind_agent(agent)
+    return registry
+
+
+def _step_handler(
+    name: str, command_type: Type[commands.Command], step_name: str, terminal: bool
+) -> Type[PipelineStepHandler]:
+    """Create a named PipelineStepHandler preset for one pipeline step."""
+
+    def __init__(self):
+        PipelineStepHandler.__init__(self, command_type, step_name, terminal)
+
+    return type(
+        name,
+        (PipelineStepHandler,),
+        {
+            "__slots__": (),
+            "__init__": __init__,
+            "__doc__": f"Handler for {command_type.__name__} commands.",
+            "__module__": __name__,
+        },
+    )
+
+
+# Named handlers kept for callers that register steps individually
+QuestionHandler = _step_handler("QuestionHandler", *PIPELINE_STEPS[0])
+CheckHandler = _step_handler("CheckHandler", *PIPELINE_STEPS[1])
+RetrieveHandler = _step_handler("RetrieveHandler", *PIPELINE_STEPS[2])
+RerankHandler = _step_handler("RerankHandler", *PIPELINE_STEPS[3])
+EnhanceHandler = _step_handler("EnhanceHandler", *PIPELINE_STEPS[4])
+UseToolsHandler = _step_handler("UseToolsHandler", *PIPELINE_STEPS[5])
+LLMResponseHandler = _step_handler("LLMResponseHandler", *PIPELINE_STEPS[6])
+FinalCheckHandler = _step_handler("FinalCheckHandler", *PIPELINE_STEPS[7])
@@ -5,24 +5,31 @@ This module provides a registry system for command handlers,
 replacing switch statements with a more maintainable and extensible design.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 
 from src.agent.domain import commands
 
 
-class CommandHandler(ABC):
-    """Abstract base class for command handlers."""
+class CommandHandler:
+    """
+    Base class for command handlers.
+
+    A plain slotted class rather than an ABC: subclasses must override
+    can_handle and handle, which raise NotImplementedError otherwise.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     def can_handle(self, command: commands.Command) -> bool:
         """Check if this handler can process the given command."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def handle(self, command: commands.Command, agent) -> Optional[commands.Command]:
         """Process the command and return the next command in the chain."""
-        pass
+        raise NotImplementedError
+
+    def bind(self, agent) -> None:
+        """Bind agent-specific state ahead of dispatch. No-op by default."""
 
 
 class CommandHandlerRegistry:
@@ -31,11 +38,17 @@ class CommandHandlerRegistry:
 
     This replaces switch statements with a more maintainable approach,
     allowing for easy extension and modification of command processing logic.
+
+    Handlers are trusted by their registration key: a handler registered for
+    a command type must handle every command of exactly that type, so dispatch
+    is a single dict lookup without a can_handle re-check. Handlers that match
+    by subclass or other criteria belong in register_fallback.
     """
 
     def __init__(self):
         self._handlers: Dict[Type[commands.Command], CommandHandler] = {}
         self._fallback_handler: Optional[CommandHandler] = None
+        self._registered_types: Tuple[Type[commands.Command], ...] = ()
 
     def register(
         self, command_type: Type[commands.Command], handler: CommandHandler
@@ -48,6 +61,7 @@ class CommandHandlerRegistry:
             handler: The handler instance for this command type
         """
         self._handlers[command_type] = handler
+        self._registered_types = tuple(self._handlers)
 
     def register_fallback(self, handler: CommandHandler) -> None:
         """
@@ -58,6 +72,18 @@ class CommandHandlerRegistry:
         """
         self._fallback_handler = handler
 
+    def bind_agent(self, agent) -> None:
+        """
+        Bind all registered handlers to the agent that will process commands.
+
+        Args:
+            agent: The agent instance whose steps the handlers call
+        """
+        for handler in self._handlers.values():
+            handler.bind(agent)
+        if self._fallback_handler is not None:
+            self._fallback_handler.bind(agent)
+
     def get_handler(self, command: commands.Command) -> Optional[CommandHandler]:
         """
         Get the appropriate handler for a command.
@@ -68,15 +94,14 @@ class CommandHandlerRegistry:
         Returns:
             The handler for this command type, or the fallback handler if no specific handler exists
         """
-        command_type = type(command)
-        handler = self._handlers.get(command_type)
-
-        if handler and handler.can_handle(command):
+        handler = self._handlers.get(type(command))
+        if handler is not None:
             return handler
 
         # Try fallback handler
-        if self._fallback_handler and self._fallback_handler.can_handle(command):
-            return self._fallback_handler
+        fallback = self._fallback_handler
+        if fallback is not None and fallback.can_handle(command):
+            return fallback
 
         return None
 
@@ -94,7 +119,12 @@ class CommandHandlerRegistry:
         Raises:
             NotImplementedError: If no handler is registered for the command type
         """
-        handler = self.get_handler(command)
+        handler = self._handlers.get(type(command))
+        if handler is None:
+            # Only reached on a dict miss, so the fallback check stays off the fast path
+            fallback = self._fallback_handler
+            if fallback is not None and fallback.can_handle(command):
+                handler = fallback
 
         if handler is None:
             raise NotImplementedError(
@@ -112,12 +142,14 @@ class CommandHandlerRegistry:
         """
         if command_type in self._handlers:
             del self._handlers[command_type]
+            self._registered_types = tuple(self._handlers)
 
     def clear(self) -> None:
         """Clear all registered handlers."""
         self._handlers.clear()
         self._fallback_handler = None
+        self._registered_types = ()
 
-    def get_registered_types(self) -> list[Type[commands.Command]]:
-        """Get a list of all registered command types."""
-        return list(self._handlers.keys())
+    def get_registered_types(self) -> Tuple[Type[commands.Command], ...]:
+        """Get all registered command types as an immutable, cached tuple."""
+        return self._registered_types
@@ -6,12 +6,16 @@ loading and management, replacing the scattered get_*_config() functions with a
 unified, testable, and maintainable solution.
 """
 
+import threading
 from functools import lru_cache
 from os import getenv
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-from src.agent.utils.constants import EnvVars, Database, URLs
+from src.agent.utils.constants import EnvVars, Database, Tracing, URLs
+
+# Project root, resolved once at import instead of on every path build
+_ROOT_DIR = str(Path(__file__).resolve().parents[3])
 
 
 class ConfigurationError(Exception):
@@ -30,17 +34,29 @@ class ConfigurationManager:
     """
 
     _instance: Optional["ConfigurationManager"] = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> "ConfigurationManager":
-        """Implement singleton pattern."""
+        """Implement thread-safe singleton pattern."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
+    def __init__(self) -> None:
+        """Initialize instance state once per singleton."""
+        if self._initialized:
+            return
+        self._env_cache: Dict[str, Optional[str]] = {}
+        self._initialized = True
+
     @property
     def root_dir(self) -> str:
         """Get the root directory of the project."""
-        return str(Path(__file__).resolve().parents[3])
+        return _ROOT_DIR
 
     def _get_env_var(
         self, key: str, required: bool = True, default: Optional[str] = None
@@ -48,6 +64,9 @@ class ConfigurationManager:
         """
         Get environment variable with optional validation.
 
+        Each key is read from the environment once and memoized until
+        clear_cache is called.
+
         Args:
             key: Environment variable key
             required: Whether the variable is required
@@ -59,7 +78,13 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: If required variable is not set
         """
-        value = getenv(key, default)
+        env_cache = self._env_cache
+        if key in env_cache:
+            value = env_cache[key]
+        else:
+            value = env_cache[key] = getenv(key)
+        if value is None:
+            value = default
         if required and value is None:
             raise ConfigurationError(f"{key} not set in environment variables")
         return value
@@ -216,6 +241,26 @@ class ConfigurationManager:
             required=False,
             default=Database.DEFAULT_TELEMETRY_ENABLED,
         )
+        bsp_max_queue_size = self._get_env_var(
+            EnvVars.OTEL_BSP_MAX_QUEUE_SIZE,
+            required=False,
+            default=Tracing.DEFAULT_BSP_MAX_QUEUE_SIZE,
+        )
+        bsp_schedule_delay_millis = self._get_env_var(
+            EnvVars.OTEL_BSP_SCHEDULE_DELAY,
+            required=False,
+            default=Tracing.DEFAULT_BSP_SCHEDULE_DELAY_MILLIS,
+        )
+        bsp_max_export_batch_size = self._get_env_var(
+            EnvVars.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+            required=False,
+            default=Tracing.DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE,
+        )
+        bsp_export_timeout_millis = self._get_env_var(
+            EnvVars.OTEL_BSP_EXPORT_TIMEOUT,
+            required=False,
+            default=Tracing.DEFAULT_BSP_EXPORT_TIMEOUT_MILLIS,
+        )
 
         return {
             "langfuse_public_key": langfuse_public_key,
@@ -224,6 +269,10 @@ class ConfigurationManager:
             "langfuse_secret_key": langfuse_secret_key,
             "otel_exporter_otlp_endpoint": URLs.LANGFUSE_OTEL_ENDPOINT,
             "telemetry_enabled": telemetry_enabled,
+            "bsp_max_queue_size": int(bsp_max_queue_size),
+            "bsp_schedule_delay_millis": int(bsp_schedule_delay_millis),
+            "bsp_max_export_batch_size": int(bsp_max_export_batch_size),
+            "bsp_export_timeout_millis": int(bsp_export_timeout_millis),
         }
 
     @lru_cache(maxsize=1)
@@ -278,6 +327,24 @@ class ConfigurationManager:
             "slack_webhook_url": slack_webhook_url,
         }
 
+    @lru_cache(maxsize=1)
+    def _pg_credentials(self) -> Tuple[str, str, str, str]:
+        """
+        Get the Postgres credentials shared by all database configurations.
+
+        Returns:
+            Tuple of user, password, host and port
+
+        Raises:
+            ConfigurationError: If required environment variables are missing
+        """
+        return (
+            self._get_env_var(EnvVars.PG_USER),
+            self._get_env_var(EnvVars.PG_PASSWORD),
+            self._get_env_var(EnvVars.PG_HOST),
+            self._get_env_var(EnvVars.PG_PORT),
+        )
+
     @lru_cache(maxsize=1)
     def get_database_config(self) -> Dict[str, Any]:
         """
@@ -289,10 +356,7 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: If required environment variables are missing
         """
-        db_user = self._get_env_var(EnvVars.PG_USER)
-        db_password = self._get_env_var(EnvVars.PG_PASSWORD)
-        db_host = self._get_env_var(EnvVars.PG_HOST)
-        db_port = self._get_env_var(EnvVars.PG_PORT)
+        db_user, db_password, db_host, db_port = self._pg_credentials()
         db_name = self._get_env_var(EnvVars.PG_NAME)
         database_type = self._get_env_var(
             EnvVars.DATABASE_TYPE,
@@ -300,8 +364,8 @@ class ConfigurationManager:
             default=Database.DEFAULT_DATABASE_TYPE,
         )
 
-        connection_string = Database.CONNECTION_STRING_TEMPLATE.format(
-            user=db_user, password=db_password, host=db_host, port=db_port, name=db_name
+        connection_string = Database.build_connection_string(
+            db_user, db_password, db_host, db_port, db_name
         )
 
         return {
@@ -320,16 +384,13 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: If required environment variables are missing
         """
-        db_user = self._get_env_var(EnvVars.PG_USER)
-        db_password = self._get_env_var(EnvVars.PG_PASSWORD)
-        db_host = self._get_env_var(EnvVars.PG_HOST)
-        db_port = self._get_env_var(EnvVars.PG_PORT)
+        db_user, db_password, db_host, db_port = self._pg_credentials()
         db_name = self._get_env_var(
             EnvVars.PG_EVAL_DB, required=False, default=Database.DEFAULT_EVAL_DB
         )
 
-        connection_string = Database.CONNECTION_STRING_TEMPLATE.format(
-            user=db_user, password=db_password, host=db_host, port=db_port, name=db_name
+        connection_string = Database.build_connection_string(
+            db_user, db_password, db_host, db_port, db_name
         )
 
         return {
@@ -361,6 +422,7 @@ class ConfigurationManager:
 
     def clear_cache(self) -> None:
         """Clear all cached configurations to force reload."""
+        self._env_cache.clear()
         # Clear LRU cache for all methods
         self.get_agent_config.cache_clear()
         self.get_llm_config.cache_clear()
@@ -371,6 +433,7 @@ class ConfigurationManager:
         self.get_logging_config.cache_clear()
         self.get_email_config.cache_clear()
         self.get_slack_config.cache_clear()
+        self._pg_credentials.cache_clear()
         self.get_database_config.cache_clear()
         self.get_evaluation_database_config.cache_clear()
 
@@ -380,57 +443,40 @@ class ConfigurationManager:
         cls._instance = None
 
 
-# Backward compatibility functions that delegate to ConfigurationManager
-def get_agent_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_agent_config()
-
-
-def get_llm_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_llm_config()
-
-
-def get_guardrails_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_guardrails_config()
-
-
-def get_rag_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_rag_config()
-
-
-def get_tools_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_tools_config()
-
-
-def get_tracing_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_tracing_config()
-
-
-def get_logging_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_logging_config()
-
-
-def get_email_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_email_config()
-
-
-def get_slack_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_slack_config()
-
-
-def get_database_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_database_config()
-
-
-def get_evaluation_database_config():
-    """Backward compatibility function."""
-    return ConfigurationManager().get_evaluation_database_config()
+# Backward compatibility functions, created lazily (PEP 562) on first access
+# and then stored as module globals. Each call resolves the current singleton,
+# so they keep working after ConfigurationManager.reset_instance().
+_COMPAT_GETTERS = frozenset(
+    {
+        "get_agent_config",
+        "get_llm_config",
+        "get_guardrails_config",
+        "get_rag_config",
+        "get_tools_config",
+        "get_tracing_config",
+        "get_logging_config",
+        "get_email_config",
+        "get_slack_config",
+        "get_database_config",
+        "get_evaluation_database_config",
+    }
+)
+
+
+def _compat_getter(name: str):
+    """Build a module-level getter that delegates to the current singleton."""
+
+    def getter():
+        return getattr(ConfigurationManager(), name)()
+
+    getter.__name__ = getter.__qualname__ = name
+    getter.__doc__ = "Backward compatibility function."
+    return getter
+
+
+def __getattr__(name: str):
+    if name in _COMPAT_GETTERS:
+        getter = _compat_getter(name)
+        globals()[name] = getter
+        return getter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
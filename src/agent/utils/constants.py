@@ -12,10 +12,15 @@ The constants are organized into logical groups:
 - ERROR_MESSAGES: Error messages and exception strings
 - DATABASE: Database-related constants
 - SECURITY: Security and sensitive data patterns
+- TRACING: Span export and sampling defaults
 - URLS: URL patterns and endpoints
+
+Prompt keys, environment variable names and status messages are annotated as
+Final so type checkers reject accidental reassignment.
 """
 
-from typing import List, Set
+import re
+from typing import Final, FrozenSet, List, Pattern, Tuple
 
 
 # =============================================================================
@@ -24,11 +29,11 @@ from typing import List, Set
 class PromptKeys:
     """Keys used in prompt template lookups."""
 
-    FINALIZE = "finalize"
-    ENHANCE = "enhance"
-    GUARDRAILS = "guardrails"
-    PRE_CHECK = "pre_check"
-    POST_CHECK = "post_check"
+    FINALIZE: Final = "finalize"
+    ENHANCE: Final = "enhance"
+    GUARDRAILS: Final = "guardrails"
+    PRE_CHECK: Final = "pre_check"
+    POST_CHECK: Final = "post_check"
 
 
 # =============================================================================
@@ -38,74 +43,81 @@ class EnvVars:
     """Environment variable names used throughout the application."""
 
     # Agent configuration
-    AGENT_PROMPTS_FILE = "agent_prompts_file"
-    SQL_PROMPTS_FILE = "sql_prompts_file"
-    SCENARIO_PROMPTS_FILE = "scenario_prompts_file"
+    AGENT_PROMPTS_FILE: Final = "agent_prompts_file"
+    SQL_PROMPTS_FILE: Final = "sql_prompts_file"
+    SCENARIO_PROMPTS_FILE: Final = "scenario_prompts_file"
 
     # LLM configuration
-    LLM_MODEL_ID = "llm_model_id"
-    LLM_TEMPERATURE = "llm_temperature"
+    LLM_MODEL_ID: Final = "llm_model_id"
+    LLM_TEMPERATURE: Final = "llm_temperature"
 
     # Guardrails configuration
-    GUARDRAILS_MODEL_ID = "guardrails_model_id"
-    GUARDRAILS_TEMPERATURE = "guardrails_temperature"
+    GUARDRAILS_MODEL_ID: Final = "guardrails_model_id"
+    GUARDRAILS_TEMPERATURE: Final = "guardrails_temperature"
 
     # RAG configuration
-    EMBEDDING_API_BASE = "embedding_api_base"
-    RETRIEVAL_API_BASE = "retrieval_api_base"
-    RANKING_API_BASE = "ranking_api_base"
-    EMBEDDING_ENDPOINT = "embedding_endpoint"
-    RANKING_ENDPOINT = "ranking_endpoint"
-    RETRIEVAL_ENDPOINT = "retrieval_endpoint"
-    N_RANKING_CANDIDATES = "n_ranking_candidates"
-    N_RETRIEVAL_CANDIDATES = "n_retrieval_candidates"
-    RETRIEVAL_TABLE = "retrieval_table"
+    EMBEDDING_API_BASE: Final = "embedding_api_base"
+    RETRIEVAL_API_BASE: Final = "retrieval_api_base"
+    RANKING_API_BASE: Final = "ranking_api_base"
+    EMBEDDING_ENDPOINT: Final = "embedding_endpoint"
+    RANKING_ENDPOINT: Final = "ranking_endpoint"
+    RETRIEVAL_ENDPOINT: Final = "retrieval_endpoint"
+    N_RANKING_CANDIDATES: Final = "n_ranking_candidates"
+    N_RETRIEVAL_CANDIDATES: Final = "n_retrieval_candidates"
+    RETRIEVAL_TABLE: Final = "retrieval_table"
 
     # Tools configuration
-    TOOLS_MODEL_ID = "tools_model_id"
-    TOOLS_MODEL_API_BASE = "tools_model_api_base"
-    TOOLS_MAX_STEPS = "tools_max_steps"
-    TOOLS_PROMPTS_FILE = "tools_prompts_file"
-    TOOLS_API_BASE = "tools_api_base"
-    TOOLS_API_LIMIT = "tools_api_limit"
+    TOOLS_MODEL_ID: Final = "tools_model_id"
+    TOOLS_MODEL_API_BASE: Final = "tools_model_api_base"
+    TOOLS_MAX_STEPS: Final = "tools_max_steps"
+    TOOLS_PROMPTS_FILE: Final = "tools_prompts_file"
+    TOOLS_API_BASE: Final = "tools_api_base"
+    TOOLS_API_LIMIT: Final = "tools_api_limit"
 
     # Tracing configuration
-    LANGFUSE_PUBLIC_KEY = "langfuse_public_key"
-    LANGFUSE_SECRET_KEY = "langfuse_secret_key"
-    LANGFUSE_PROJECT_ID = "langfuse_project_id"
-    LANGFUSE_HOST = "langfuse_host"
-    TELEMETRY_ENABLED = "telemetry_enabled"
+    LANGFUSE_PUBLIC_KEY: Final = "langfuse_public_key"
+    LANGFUSE_SECRET_KEY: Final = "langfuse_secret_key"
+    LANGFUSE_PROJECT_ID: Final = "langfuse_project_id"
+    LANGFUSE_HOST: Final = "langfuse_host"
+    TELEMETRY_ENABLED: Final = "telemetry_enabled"
+    # Process-level flag exported by setup_tracing ("true" when spans are exported)
+    TELEMETRY_ACTIVE: Final = "TELEMETRY_ENABLED"
+    LANGFUSE_SAMPLE_RATE: Final = "langfuse_sample_rate"
+    OTEL_BSP_MAX_QUEUE_SIZE: Final = "OTEL_BSP_MAX_QUEUE_SIZE"
+    OTEL_BSP_SCHEDULE_DELAY: Final = "OTEL_BSP_SCHEDULE_DELAY"
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE: Final = "OTEL_BSP_MAX_EXPORT_BATCH_SIZE"
+    OTEL_BSP_EXPORT_TIMEOUT: Final = "OTEL_BSP_EXPORT_TIMEOUT"
 
     # Logging configuration
-    LOGGING_LEVEL = "logging_level"
-    LOGGING_FORMAT = "logging_format"
+    LOGGING_LEVEL: Final = "logging_level"
+    LOGGING_FORMAT: Final = "logging_format"
 
     # Email configuration
-    SMTP_HOST = "smtp_host"
-    SMTP_PORT = "smtp_port"
-    RECEIVER_EMAIL = "receiver_email"
-    SENDER_EMAIL = "sender_email"
-    APP_PASSWORD = "app_password"
+    SMTP_HOST: Final = "smtp_host"
+    SMTP_PORT: Final = "smtp_port"
+    RECEIVER_EMAIL: Final = "receiver_email"
+    SENDER_EMAIL: Final = "sender_email"
+    APP_PASSWORD: Final = "app_password"
 
     # Slack configuration
-    SLACK_WEBHOOK_URL = "slack_webhook_url"
+    SLACK_WEBHOOK_URL: Final = "slack_webhook_url"
 
     # Database configuration
-    PG_USER = "PG_USER"
-    PG_PASSWORD = "PG_PASSWORD"
-    PG_HOST = "PG_HOST"
-    PG_PORT = "PG_PORT"
-    PG_NAME = "PG_NAME"
-    PG_EVAL_DB = "PG_EVAL_DB"
-    DATABASE_TYPE = "database_type"
+    PG_USER: Final = "PG_USER"
+    PG_PASSWORD: Final = "PG_PASSWORD"
+    PG_HOST: Final = "PG_HOST"
+    PG_PORT: Final = "PG_PORT"
+    PG_NAME: Final = "PG_NAME"
+    PG_EVAL_DB: Final = "PG_EVAL_DB"
+    DATABASE_TYPE: Final = "database_type"
 
     # Cache configuration
-    REDIS_HOST = "REDIS_HOST"
-    REDIS_PORT = "REDIS_PORT"
-    REDIS_DB = "REDIS_DB"
-    REDIS_PASSWORD = "REDIS_PASSWORD"
-    REDIS_MAX_CONNECTIONS = "REDIS_MAX_CONNECTIONS"
-    CACHE_ENABLED = "CACHE_ENABLED"
+    REDIS_HOST: Final = "REDIS_HOST"
+    REDIS_PORT: Final = "REDIS_PORT"
+    REDIS_DB: Final = "REDIS_DB"
+    REDIS_PASSWORD: Final = "REDIS_PASSWORD"
+    REDIS_MAX_CONNECTIONS: Final = "REDIS_MAX_CONNECTIONS"
+    CACHE_ENABLED: Final = "CACHE_ENABLED"
 
 
 # =============================================================================
@@ -114,22 +126,22 @@ class EnvVars:
 class StatusMessages:
     """Status messages displayed during different processing steps."""
 
-    PROCESSING = "Processing..."
-    CHECKING = "Checking..."
-    RETRIEVING = "Retrieving..."
-    ENHANCING = "Enhancing..."
-    FINETUNING = "Finetuning..."
-    ANSWERING = "Answering..."
-    FINALIZING = "Finalizing..."
-    EVALUATING = "Evaluating..."
-    GROUNDING = "Grounding..."
-    FILTERING = "Filtering..."
-    JOINING = "Joining..."
-    AGGREGATING = "Aggregating..."
-    CONSTRUCTING = "Constructing..."
-    VALIDATING = "Validating..."
-    EXECUTING = "Executing..."
-    THINKING = "Thinking..."
+    PROCESSING: Final = "Processing..."
+    CHECKING: Final = "Checking..."
+    RETRIEVING: Final = "Retrieving..."
+    ENHANCING: Final = "Enhancing..."
+    FINETUNING: Final = "Finetuning..."
+    ANSWERING: Final = "Answering..."
+    FINALIZING: Final = "Finalizing..."
+    EVALUATING: Final = "Evaluating..."
+    GROUNDING: Final = "Grounding..."
+    FILTERING: Final = "Filtering..."
+    JOINING: Final = "Joining..."
+    AGGREGATING: Final = "Aggregating..."
+    CONSTRUCTING: Final = "Constructing..."
+    VALIDATING: Final = "Validating..."
+    EXECUTING: Final = "Executing..."
+    THINKING: Final = "Thinking..."
 
 
 # =============================================================================
@@ -192,8 +204,22 @@ class Database:
 
     TYPE_POSTGRES = "postgres"
     DEFAULT_EVAL_DB = "evaluation"
-    CONNECTION_STRING_TEMPLATE = (
-        "postgresql+psycopg2://{user}:{password}@{host}:{port}/{name}"
+
+    @staticmethod
+    def build_connection_string(
+        user: str, password: str, host: str, port: str, name: str
+    ) -> str:
+        """
+        Build the PostgreSQL connection string.
+
+        This is the single definition of the connection format;
+        CONNECTION_STRING_TEMPLATE is derived from it.
+        """
+        return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{name}"
+
+    # str.format template derived from build_connection_string
+    CONNECTION_STRING_TEMPLATE = build_connection_string(
+        "{user}", "{password}", "{host}", "{port}", "{name}"
     )
 
     # Default values
@@ -228,31 +254,87 @@ class Security:
     FILTERED_PLACEHOLDER = "[FILTERED]"
 
     # Sensitive keys that should be filtered from logs
-    SENSITIVE_KEYS: Set[str] = {
-        "password",
-        "passwd",
-        "pwd",
-        "secret",
-        "api_key",
-        "token",
-        "auth",
-        "authorization",
-        "credential",
-        "key",
-        "private_key",
-        "connection_string",
-        "database_url",
-        "dsn",
-    }
-
-    # Patterns for sensitive data in string values
+    SENSITIVE_KEYS: FrozenSet[str] = frozenset(
+        {
+            "password",
+            "passwd",
+            "pwd",
+            "secret",
+            "api_key",
+            "token",
+            "auth",
+            "authorization",
+            "credential",
+            "key",
+            "private_key",
+            "connection_string",
+            "database_url",
+            "dsn",
+        }
+    )
+
+    # Lowercased lookup set so checks normalize only the incoming key
+    SENSITIVE_KEYS_LOWER: FrozenSet[str] = frozenset(
+        key.lower() for key in SENSITIVE_KEYS
+    )
+
+    # Patterns for sensitive data in string values (kept for backward
+    # compatibility; prefer SENSITIVE_PATTERNS_COMPILED). Quantifiers are
+    # possessive so matching stays linear on long log lines; the URL password
+    # run stops at the next "://" so overlapping prefixes are scanned once.
     SENSITIVE_PATTERNS: List[str] = [
-        r"password=[\w\-_]+",
-        r"://[^:]+:[^@]+@",  # URLs with credentials
-        r"Bearer\s+[\w\-_\.]+",  # Bearer tokens
-        r"key_[\w\-_]+",  # API keys
+        r"password=[\w\-]++",
+        r"://[^:\s/@]++:(?:(?!://)[^@\s])++@",  # URLs with credentials
+        r"Bearer\s++[\w\-.]++",  # Bearer tokens
+        r"key_[\w\-]++",  # API keys
     ]
 
+    # All sensitive patterns as one case-insensitive alternation, compiled once
+    SENSITIVE_PATTERNS_COMPILED: Pattern[str] = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in SENSITIVE_PATTERNS), re.IGNORECASE
+    )
+
+    # Lowercase literal each sensitive pattern starts with; a value containing
+    # none of them cannot match, so the regex is skipped. Keep in sync with
+    # SENSITIVE_PATTERNS.
+    SENSITIVE_LITERALS: Tuple[str, ...] = ("password=", "://", "bearer", "key_")
+
+    @classmethod
+    def contains_sensitive(cls, value: str) -> bool:
+        """Check whether value contains any sensitive pattern."""
+        lowered = value.lower()
+        if not any(literal in lowered for literal in cls.SENSITIVE_LITERALS):
+            return False
+        return cls.SENSITIVE_PATTERNS_COMPILED.search(value) is not None
+
+    @classmethod
+    def is_sensitive(cls, key: str) -> bool:
+        """Check whether a key names sensitive data, ignoring case."""
+        return key.lower() in cls.SENSITIVE_KEYS_LOWER
+
+    @classmethod
+    def filter_string(cls, value: str) -> str:
+        """Replace every sensitive pattern in value in a single pass."""
+        lowered = value.lower()
+        if not any(literal in lowered for literal in cls.SENSITIVE_LITERALS):
+            return value
+        return cls.SENSITIVE_PATTERNS_COMPILED.sub(cls.FILTERED_PLACEHOLDER, value)
+
+
+# =============================================================================
+# TRACING CONSTANTS
+# =============================================================================
+class Tracing:
+    """Defaults for span export and sampling."""
+
+    DEFAULT_BSP_MAX_QUEUE_SIZE = 4096
+    DEFAULT_BSP_SCHEDULE_DELAY_MILLIS = 1000
+    DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE = 256
+    DEFAULT_BSP_EXPORT_TIMEOUT_MILLIS = 10000
+
+    # Fraction of q_ids whose handler spans are recorded
+    DEFAULT_SAMPLE_RATE = 1.0
+
 
 # =============================================================================
 # URL CONSTANTS
@@ -313,3 +395,4 @@ DEFAULT_DB_TYPE = Database.DEFAULT_DATABASE_TYPE
 FILTERED = Security.FILTERED_PLACEHOLDER
 SENSITIVE_KEYS = Security.SENSITIVE_KEYS
 SENSITIVE_PATTERNS = Security.SENSITIVE_PATTERNS
+SENSITIVE_PATTERNS_COMPILED = Security.SENSITIVE_PATTERNS_COMPILED
@@ -2,12 +2,63 @@
 
 import inspect
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 
 T = TypeVar("T")
 
 
+# Disposal routine per instance type, built from the first instance seen
+_DISPOSERS: "WeakKeyDictionary[type, Callable[[Any], None]]" = WeakKeyDictionary()
+
+
+def _build_disposer(instance: Any) -> Callable[[Any], None]:
+    """Build and cache the disposal routine for the type of an instance."""
+    has_dispose = callable(getattr(instance, "dispose", None))
+    has_exit = callable(getattr(instance, "__exit__", None))
+
+    def disposer(target: Any) -> None:
+        if has_dispose:
+            try:
+                target.dispose()
+            except Exception:
+                pass  # Silently ignore disposal errors
+
+        if has_exit:
+            try:
+                target.__exit__(None, None, None)
+            except Exception:
+                pass  # Silently ignore disposal errors
+
+    _DISPOSERS[type(instance)] = disposer
+    return disposer
+
+
+def _is_disposable(instance: Any) -> bool:
+    """Check whether an instance supports disposal."""
+    return hasattr(instance, "dispose") or hasattr(instance, "__exit__")
+
+
+@lru_cache(maxsize=None)
+def _constructor_dependencies(implementation_type: Type) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get the annotated constructor parameters of a type as (name, annotation) pairs.
+
+    The signature is inspected once per implementation type and reused for
+    every later resolution.
+    """
+    signature = inspect.signature(implementation_type.__init__)
+    parameters = list(signature.parameters.values())[1:]  # Skip 'self'
+
+    return tuple(
+        (param.name, param.annotation)
+        for param in parameters
+        if param.annotation != param.empty
+    )
+
+
 class Lifetime(Enum):
     """Service lifetime enumeration."""
 
@@ -17,7 +68,23 @@ class Lifetime(Enum):
 
 
 class ServiceRegistration:
-    """Represents a service registration."""
+    """
+    Represents a service registration.
+
+    A pre-built instance is stored as the singleton instance up front, so it
+    resolves through the regular singleton path. It is never tracked for
+    disposal, as its owner is whoever registered it.
+    """
+
+    __slots__ = (
+        "service_type",
+        "implementation",
+        "factory",
+        "instance",
+        "lifetime",
+        "singleton_instance",
+        "singleton_is_disposable",
+    )
 
     def __init__(
         self,
@@ -33,16 +100,39 @@ class ServiceRegistration:
         self.instance = instance
         self.lifetime = lifetime
         self.singleton_instance: Optional[Any] = None
+        self.singleton_is_disposable: Optional[bool] = None
+
+        if instance is not None:
+            self.lifetime = Lifetime.SINGLETON
+            self.singleton_instance = instance
+            self.singleton_is_disposable = False
 
 
 class DIContainer:
     """Dependency Injection container."""
 
+    __slots__ = (
+        "_services",
+        "_parent",
+        "_scoped_instances",
+        "_disposables",
+        "_disposable_ids",
+        "_resolved_cache",
+        "_generation",
+        "_cache_generation",
+    )
+
     def __init__(self, parent: Optional["DIContainer"] = None):
         self._services: Dict[Type, ServiceRegistration] = {}
         self._parent = parent
         self._scoped_instances: Dict[Type, Any] = {}
         self._disposables: list = []
+        self._disposable_ids: Set[int] = set()
+        # Registrations found in parent containers, valid while no container
+        # in the chain has registered anything since (shared generation count)
+        self._resolved_cache: Dict[Type, ServiceRegistration] = {}
+        self._generation: List[int] = parent._generation if parent else [0]
+        self._cache_generation = self._generation[0]
 
     def register(
         self,
@@ -54,8 +144,7 @@ class DIContainer:
         registration = ServiceRegistration(
             service_type=service_type, implementation=implementation, lifetime=lifetime
         )
-        self._services[service_type] = registration
-        return self
+        return self._add_registration(registration)
 
     def register_factory(
         self,
@@ -67,15 +156,19 @@ class DIContainer:
         registration = ServiceRegistration(
             service_type=service_type, factory=factory, lifetime=lifetime
         )
-        self._services[service_type] = registration
-        return self
+        return self._add_registration(registration)
 
     def register_instance(self, service_type: Type[T], instance: T) -> "DIContainer":
         """Register a service type with a specific instance (singleton)."""
         registration = ServiceRegistration(
             service_type=service_type, instance=instance, lifetime=Lifetime.SINGLETON
         )
-        self._services[service_type] = registration
+        return self._add_registration(registration)
+
+    def _add_registration(self, registration: ServiceRegistration) -> "DIContainer":
+        """Store a registration and invalidate cached parent lookups."""
+        self._services[registration.service_type] = registration
+        self._generation[0] += 1
         return self
 
     def resolve(self, service_type: Type[T]) -> T:
@@ -115,54 +208,49 @@ class DIContainer:
 
         self._scoped_instances.clear()
         self._disposables.clear()
+        self._disposable_ids.clear()
 
     def _dispose_instance(self, instance):
         """Dispose an individual instance if it supports disposal."""
-        if hasattr(instance, "dispose") and callable(getattr(instance, "dispose")):
-            try:
-                instance.dispose()
-            except Exception:
-                pass  # Silently ignore disposal errors
-
-        if hasattr(instance, "__exit__") and callable(getattr(instance, "__exit__")):
-            try:
-                instance.__exit__(None, None, None)
-            except Exception:
-                pass  # Silently ignore disposal errors
+        disposer = _DISPOSERS.get(type(instance))
+        if disposer is None:
+            disposer = _build_disposer(instance)
+        disposer(instance)
 
     def _get_registration(self, service_type: Type) -> Optional[ServiceRegistration]:
         """Get registration for a service type, checking parent containers."""
-        if service_type in self._services:
-            return self._services[service_type]
+        registration = self._services.get(service_type)
+        if registration is not None or self._parent is None:
+            return registration
+
+        if self._cache_generation != self._generation[0]:
+            self._resolved_cache.clear()
+            self._cache_generation = self._generation[0]
 
-        if self._parent is not None:
-            return self._parent._get_registration(service_type)
+        registration = self._resolved_cache.get(service_type)
+        if registration is None:
+            registration = self._parent._get_registration(service_type)
+            if registration is not None:
+                self._resolved_cache[service_type] = registration
 
-        return None
+        return registration
 
     def _create_instance(self, registration: ServiceRegistration) -> Any:
         """Create an instance based on registration configuration."""
-        # Handle pre-existing instance
-        if registration.instance is not None:
-            return registration.instance
-
         # Handle singleton lifetime
         if registration.lifetime == Lifetime.SINGLETON:
-            if registration.singleton_instance is not None:
-                instance = registration.singleton_instance
-                # Track for disposal if it's disposable and we're in a scoped container
-                if (
-                    hasattr(instance, "dispose") or hasattr(instance, "__exit__")
-                ) and instance not in self._disposables:
-                    self._disposables.append(instance)
-                return instance
-
-            instance = self._instantiate(registration)
-            registration.singleton_instance = instance
-
-            # Track disposable instances
-            if hasattr(instance, "dispose") or hasattr(instance, "__exit__"):
-                self._disposables.append(instance)
+            instance = registration.singleton_instance
+            if instance is None:
+                instance = self._instantiate(registration)
+                registration.singleton_instance = instance
+                registration.singleton_is_disposable = _is_disposable(instance)
+
+            # Track for disposal in this container if not tracked yet
+            if (
+                registration.singleton_is_disposable
+                and id(instance) not in self._disposable_ids
+            ):
+                self._track_disposable(instance)
 
             return instance
 
@@ -175,8 +263,8 @@ class DIContainer:
             self._scoped_instances[registration.service_type] = instance
 
             # Track disposable instances
-            if hasattr(instance, "dispose") or hasattr(instance, "__exit__"):
-                self._disposables.append(instance)
+            if _is_disposable(instance):
+                self._track_disposable(instance)
 
             return instance
 
@@ -184,13 +272,16 @@ class DIContainer:
         instance = self._instantiate(registration)
 
         # Track disposable transient instances if we have a parent (scoped container)
-        if self._parent and (
-            hasattr(instance, "dispose") or hasattr(instance, "__exit__")
-        ):
-            self._disposables.append(instance)
+        if self._parent and _is_disposable(instance):
+            self._track_disposable(instance)
 
         return instance
 
+    def _track_disposable(self, instance: Any) -> None:
+        """Record an instance for disposal when this container is disposed."""
+        self._disposables.append(instance)
+        self._disposable_ids.add(id(instance))
+
     def _instantiate(self, registration: ServiceRegistration) -> Any:
         """Create a new instance using factory or constructor."""
         if registration.factory is not None:
@@ -206,16 +297,11 @@ class DIContainer:
     def _create_with_dependencies(self, implementation_type: Type) -> Any:
         """Create an instance and resolve its constructor dependencies."""
         try:
-            # Get constructor signature
-            signature = inspect.signature(implementation_type.__init__)
-            parameters = list(signature.parameters.values())[1:]  # Skip 'self'
-
             # Resolve constructor dependencies
-            args = {}
-            for param in parameters:
-                if param.annotation != param.empty:
-                    dependency = self.resolve(param.annotation)
-                    args[param.name] = dependency
+            args = {
+                name: self.resolve(annotation)
+                for name, annotation in _constructor_dependencies(implementation_type)
+            }
 
             return implementation_type(**args)
 
@@ -1,10 +1,18 @@
+from functools import lru_cache
 from typing import Any
 
-from jinja2 import StrictUndefined, Template
+from jinja2 import Environment, StrictUndefined, Template
+
+_environment = Environment(undefined=StrictUndefined, auto_reload=False)
+
+
+@lru_cache(maxsize=512)
+def _compile_template(template: str) -> Template:
+    return _environment.from_string(template)
 
 
 def populate_template(template: str, variables: dict[str, Any]) -> str:
-    compiled_template = Template(template, undefined=StrictUndefined)
+    compiled_template = _compile_template(template)
     try:
         return compiled_template.render(**variables)
     except Exception as e:
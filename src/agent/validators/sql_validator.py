@@ -9,6 +9,8 @@ from loguru import logger
 class SQLValidator:
     """Validates SQL queries to prevent injection attacks."""
 
+    __slots__ = ()
+
     # DDL (Data Definition Language) operations that modify schema
     FORBIDDEN_DDL_OPERATIONS = frozenset(
         ["CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME"]
@@ -33,6 +35,19 @@ class SQLValidator:
         | FORBIDDEN_OTHER_OPERATIONS
     )
 
+    # Single alternation so the query is scanned once for any forbidden keyword
+    FORBIDDEN_OPERATION_PATTERN = re.compile(
+        r"\b(" + "|".join(sorted(FORBIDDEN_OPERATIONS)) + r")\b"
+    )
+
+    # Plain UNION (UNION ALL is allowed)
+    UNION_PATTERN = re.compile(r"\bUNION\b(?!\s+ALL)")
+
+    # String literals and comments, removed in one left-to-right pass
+    LITERALS_AND_COMMENTS_PATTERN = re.compile(
+        r"'[^']*'|\"[^\"]*\"|--[^\n]*|/\*.*?\*/", re.DOTALL
+    )
+
     # Allowed operations (whitelist approach)
     ALLOWED_OPERATIONS = frozenset(["SELECT", "WITH"])
 
@@ -50,26 +65,23 @@ class SQLValidator:
             ValueError: If query contains forbidden operations
         """
         # Check for empty or None queries
-        if not sql_query or sql_query.strip() == "":
+        stripped_query = sql_query.strip() if sql_query else ""
+        if not stripped_query:
             raise ValueError("Empty SQL query")
 
-        # Normalize query for checking
-        normalized_query = sql_query.upper().strip()
+        # Normalize query for checking (reuses the single strip above)
+        normalized_query = stripped_query.upper()
 
-        # List of forbidden operations
-        forbidden_operations = self.FORBIDDEN_OPERATIONS
-
-        # Check for forbidden operations
-        for operation in forbidden_operations:
-            # Use word boundaries to match whole words
-            pattern = rf"\b{operation}\b"
-            if re.search(pattern, normalized_query):
-                logger.warning(
-                    "SQL validation failed: {operation} operation detected in query",
-                    operation=operation,
-                    query_snippet=sql_query[:100],
-                )
-                raise ValueError(f"{operation} operations are not allowed")
+        # Check for forbidden operations (whole words, first occurrence wins)
+        match = self.FORBIDDEN_OPERATION_PATTERN.search(normalized_query)
+        if match:
+            operation = match.group(1)
+            logger.warning(
+                "SQL validation failed: {operation} operation detected in query",
+                operation=operation,
+                query_snippet=sql_query[:100],
+            )
+            raise ValueError(f"{operation} operations are not allowed")
 
         # Check for multiple statements (semicolon not in string)
         # Simple check - a more robust solution would parse the SQL
@@ -82,7 +94,7 @@ class SQLValidator:
 
         # Check for UNION (often used in SQL injection)
         # Allow UNION ALL but be suspicious of plain UNION
-        if re.search(r"\bUNION\b(?!\s+ALL)", normalized_query):
+        if self.UNION_PATTERN.search(normalized_query):
             logger.warning(
                 "SQL validation failed: UNION operation detected",
                 query_snippet=sql_query[:100],
@@ -99,19 +111,13 @@ class SQLValidator:
         This is a simple check that looks for semicolons outside of strings.
         A more robust implementation would use a proper SQL parser.
         """
-        # Remove string literals to avoid false positives
-        # This is a simplified approach
-        cleaned = sql_query
-
-        # Remove single-quoted strings
-        cleaned = re.sub(r"'[^']*'", "", cleaned)
-
-        # Remove double-quoted strings
-        cleaned = re.sub(r'"[^"]*"', "", cleaned)
+        # Without a semicolon there is nothing to disambiguate
+        if ";" not in sql_query:
+            return False
 
-        # Remove comments
-        cleaned = re.sub(r"--.*$", "", cleaned, flags=re.MULTILINE)
-        cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.DOTALL)
+        # Remove string literals and comments to avoid false positives
+        # This is a simplified approach
+        cleaned = self.LITERALS_AND_COMMENTS_PATTERN.sub("", sql_query)
 
         # Check for multiple semicolons or semicolon not at the end
         # Count semicolons
@@ -1,4 +1,5 @@
 import asyncio
+import random
 from unittest.mock import AsyncMock, MagicMock, patch
 import pandas as pd
 import pytest
@@ -117,6 +118,39 @@ class TestAsyncDatabaseAdapter:
             # Should try max_retries + 1 times (initial + retries)
             assert mock_create.call_count == database_instance.max_retries + 1
 
+    @pytest.mark.asyncio
+    async def test_connect_backoff_uses_full_jitter(self, database_instance):
+        """Test that retry delays are drawn from [0, capped backoff]."""
+        database_instance.max_retries = 4
+        database_instance.base_delay = 0.5
+        database_instance.max_delay = 3.0
+
+        with (
+            patch.object(
+                database_instance, "_create_async_engine", new_callable=AsyncMock
+            ) as mock_create,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch(
+                "src.agent.adapters.database.random.uniform",
+                wraps=random.uniform,
+            ) as mock_uniform,
+        ):
+            mock_create.side_effect = Exception("Persistent connection error")
+
+            with pytest.raises(DatabaseConnectionException):
+                await database_instance.connect()
+
+        # Caps: 0.5, 1.0, 2.0, 3.0 (capped)
+        expected_caps = [0.5, 1.0, 2.0, 3.0]
+        actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
+
+        assert [call.args for call in mock_uniform.call_args_list] == [
+            (0, cap) for cap in expected_caps
+        ]
+        assert len(actual_delays) == len(expected_caps)
+        for cap, actual in zip(expected_caps, actual_delays):
+            assert 0 <= actual <= cap
+
     @pytest.mark.asyncio
     async def test_disconnect(self, database_instance, mock_engine):
         """Test async disconnect."""
@@ -9,8 +9,11 @@ import pytest
 from unittest.mock import Mock
 
 from src.agent.domain import commands, events
-from src.agent.utils.command_registry import CommandHandlerRegistry
+from src.agent.utils.command_registry import CommandHandler, CommandHandlerRegistry
 from src.agent.utils.command_handlers import (
+    PIPELINE_STEPS,
+    PipelineStepHandler,
+    build_default_registry,
     QuestionHandler,
     CheckHandler,
     RetrieveHandler,
@@ -48,6 +51,87 @@ class TestCommandHandlerRegistry:
         ):
             registry.process(unknown_cmd, Mock())
 
+    def test_registry_process_dispatches_without_can_handle(self):
+        """Test that process trusts the registration key and skips can_handle."""
+        registry = CommandHandlerRegistry()
+        handler = Mock()
+        handler.handle.return_value = None
+        registry.register(commands.Question, handler)
+
+        question_cmd = commands.Question(question="test", q_id="test")
+        agent = Mock()
+        registry.process(question_cmd, agent)
+
+        handler.handle.assert_called_once_with(question_cmd, agent)
+        handler.can_handle.assert_not_called()
+
+    def test_get_handler_returns_registered_handler_without_can_handle(self):
+        """Test that a registered handler is returned without re-checking it."""
+        registry = CommandHandlerRegistry()
+        handler = Mock()
+        registry.register(commands.Question, handler)
+
+        question_cmd = commands.Question(question="test", q_id="test")
+
+        assert registry.get_handler(question_cmd) is handler
+        handler.can_handle.assert_not_called()
+
+    def test_registry_process_uses_fallback_for_unregistered_type(self):
+        """Test that unregistered command types go to the fallback handler."""
+        registry = CommandHandlerRegistry()
+        fallback = Mock()
+        fallback.handle.return_value = "fallback"
+        registry.register_fallback(fallback)
+
+        question_cmd = commands.Question(question="test", q_id="test")
+
+        assert registry.process(question_cmd, Mock()) == "fallback"
+
+    def test_registry_process_raises_when_fallback_declines(self):
+        """Test that a fallback whose can_handle is False is not dispatched to."""
+        registry = CommandHandlerRegistry()
+        fallback = Mock()
+        fallback.can_handle.side_effect = lambda cmd: isinstance(cmd, commands.Check)
+        registry.register_fallback(fallback)
+
+        question_cmd = commands.Question(question="test", q_id="test")
+
+        with pytest.raises(NotImplementedError, match="Question"):
+            registry.process(question_cmd, Mock())
+        assert registry.get_handler(question_cmd) is None
+        fallback.handle.assert_not_called()
+
+    def test_registry_bind_agent_prebinds_handler_steps(self):
+        """Test that bound handlers call the agent step captured at bind time."""
+        registry = CommandHandlerRegistry()
+        registry.register(commands.Question, QuestionHandler())
+
+        bound_agent = Mock()
+        bound_step = bound_agent.prepare_guardrails_check
+        bound_step.return_value = "bound"
+        registry.bind_agent(bound_agent)
+        bound_agent.prepare_guardrails_check = Mock(return_value="looked up")
+
+        question_cmd = commands.Question(question="test", q_id="test")
+        result = registry.process(question_cmd, bound_agent)
+
+        assert result == "bound"
+        bound_step.assert_called_once_with(question_cmd)
+
+    def test_registered_types_tuple_tracks_registrations(self):
+        """Test that registered types are a cached tuple kept in sync."""
+        registry = CommandHandlerRegistry()
+        registry.register(commands.Question, QuestionHandler())
+        registry.register(commands.Check, CheckHandler())
+
+        registered = registry.get_registered_types()
+        assert registered == (commands.Question, commands.Check)
+        assert registry.get_registered_types() is registered
+
+        registry.unregister(commands.Question)
+
+        assert registry.get_registered_types() == (commands.Check,)
+
     def test_registry_can_clear_all_handlers(self):
         """Test that all handlers can be cleared."""
         registry = CommandHandlerRegistry()
@@ -335,3 +419,78 @@ class TestRegistryIntegration:
             commands.FinalCheck,
         }
         assert set(registry.get_registered_types()) == expected_types
+
+
+class TestHandlerSlots:
+    """Test that command handlers are slotted, non-ABC classes."""
+
+    @pytest.mark.parametrize(
+        "handler_cls",
+        [
+            QuestionHandler,
+            CheckHandler,
+            RetrieveHandler,
+            RerankHandler,
+            EnhanceHandler,
+            UseToolsHandler,
+            LLMResponseHandler,
+            FinalCheckHandler,
+        ],
+    )
+    def test_handlers_have_no_instance_dict(self, handler_cls):
+        """Test that handler instances carry no per-instance __dict__."""
+        handler = handler_cls()
+
+        assert isinstance(handler, CommandHandler)
+        assert not hasattr(handler, "__dict__")
+
+    def test_base_handler_methods_raise_not_implemented(self):
+        """Test that the base handler requires subclasses to override its methods."""
+        handler = CommandHandler()
+        question_cmd = commands.Question(question="test", q_id="test")
+
+        with pytest.raises(NotImplementedError):
+            handler.can_handle(question_cmd)
+        with pytest.raises(NotImplementedError):
+            handler.handle(question_cmd, Mock())
+
+
+class TestPipelineStepHandler:
+    """Test the data-driven pipeline step handler."""
+
+    def test_pipeline_step_handler_forwards_to_named_step(self):
+        """Test that the handler calls the configured agent step."""
+        handler = PipelineStepHandler(commands.Rerank, "prepare_enhancement")
+        rerank_cmd = commands.Rerank(question="test", q_id="test")
+
+        mock_agent = Mock()
+        mock_agent.prepare_enhancement.return_value = "enhanced"
+
+        assert handler.can_handle(rerank_cmd) is True
+        assert handler.handle(rerank_cmd, mock_agent) == "enhanced"
+
+    def test_build_default_registry_covers_pipeline_and_binds_agent(self):
+        """Test that the default registry registers every step bound to the agent."""
+        mock_agent = Mock()
+        registry = build_default_registry(mock_agent)
+
+        assert set(registry.get_registered_types()) == {
+            command_type for command_type, _, _ in PIPELINE_STEPS
+        }
+
+        final_check_cmd = commands.FinalCheck(question="test", q_id="test")
+        assert registry.process(final_check_cmd, mock_agent) is None
+        mock_agent.prepare_evaluation.assert_called_once_with(final_check_cmd)
+
+    def test_bound_handler_dispatches_to_the_agent_passed_in(self):
+        """Test that a bound handler still honours a different agent argument."""
+        bound_agent = Mock()
+        other_agent = Mock()
+        other_agent.prepare_enhancement.return_value = "other"
+        handler = PipelineStepHandler(commands.Rerank, "prepare_enhancement")
+        handler.bind(bound_agent)
+        rerank_cmd = commands.Rerank(question="test", q_id="test")
+
+        assert handler.handle(rerank_cmd, other_agent) == "other"
+        other_agent.prepare_enhancement.assert_called_once_with(rerank_cmd)
+        bound_agent.prepare_enhancement.assert_not_called()
@@ -6,10 +6,12 @@ that replaces scattered get_*_config() functions with a unified manager.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 from pathlib import Path
 
 from src.agent.utils.config_manager import ConfigurationManager, ConfigurationError
+from src.agent.utils.constants import Database
 
 
 class TestConfigurationManager:
@@ -73,6 +75,24 @@ class TestConfigurationManager:
         with pytest.raises(ConfigurationError, match="llm_model_id not set"):
             self.config_manager.get_llm_config()
 
+    @patch("src.agent.utils.config_manager.getenv")
+    def test_get_tracing_config_includes_batch_span_defaults(self, mock_getenv):
+        """Test that tracing config falls back to the batch span processor defaults."""
+        mock_getenv.side_effect = lambda key, default=None: {
+            "langfuse_public_key": "pk",
+            "langfuse_secret_key": "sk",
+            "langfuse_project_id": "project",
+            "langfuse_host": "http://localhost",
+            "OTEL_BSP_MAX_QUEUE_SIZE": "128",
+        }.get(key, default)
+
+        config = self.config_manager.get_tracing_config()
+
+        assert config["bsp_max_queue_size"] == 128
+        assert config["bsp_schedule_delay_millis"] == 1000
+        assert config["bsp_max_export_batch_size"] == 256
+        assert config["bsp_export_timeout_millis"] == 10000
+
     def test_get_all_configs_returns_comprehensive_configuration(self):
         """Test that get_all_configs returns all configuration sections."""
         with patch.object(
@@ -92,6 +112,26 @@ class TestConfigurationManager:
                     assert "llm" in all_configs
                     assert "rag" in all_configs
 
+    def test_get_all_configs_keeps_section_order(self):
+        """Test that all sections come back in a stable order."""
+        with patch.object(self.config_manager, "_get_env_var", return_value="1"):
+            all_configs = self.config_manager.get_all_configs()
+
+        assert list(all_configs) == [
+            "agent",
+            "llm",
+            "guardrails",
+            "rag",
+            "tools",
+            "tracing",
+            "logging",
+            "email",
+            "slack",
+            "database",
+            "evaluation_database",
+        ]
+        assert all_configs["llm"] == {"model_id": "1", "temperature": "1"}
+
     def test_singleton_behavior(self):
         """Test that ConfigurationManager follows singleton pattern."""
         manager1 = ConfigurationManager()
@@ -100,6 +140,23 @@ class TestConfigurationManager:
         # Should be the same instance
         assert manager1 is manager2
 
+    def test_singleton_is_created_once_across_threads(self):
+        """Test that concurrent first access yields a single instance."""
+        ConfigurationManager.reset_instance()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            managers = list(executor.map(lambda _: ConfigurationManager(), range(32)))
+
+        assert all(manager is managers[0] for manager in managers)
+
+    def test_reconstruction_keeps_instance_state(self):
+        """Test that calling the constructor again does not re-run initialization."""
+        self.config_manager._env_cache["llm_model_id"] = "cached-model"
+
+        manager = ConfigurationManager()
+
+        assert manager._env_cache == {"llm_model_id": "cached-model"}
+
     @patch("src.agent.utils.config_manager.getenv")
     def test_caching_behavior(self, mock_getenv):
         """Test that configuration is cached after first load."""
@@ -118,6 +175,57 @@ class TestConfigurationManager:
         # getenv should only be called during first load (due to LRU cache)
         assert mock_getenv.call_count >= 2  # At least 2 calls for 2 env vars
 
+    @patch("src.agent.utils.config_manager.getenv")
+    def test_env_vars_are_read_once_until_cache_cleared(self, mock_getenv):
+        """Test that each environment variable is read once per cache lifetime."""
+        mock_getenv.side_effect = lambda key, default=None: {
+            "llm_model_id": "gpt-4",
+        }.get(key, default)
+
+        self.config_manager._get_env_var("llm_model_id")
+        self.config_manager._get_env_var("llm_model_id")
+        assert (
+            self.config_manager._get_env_var(
+                "llm_temperature", required=False, default="0.1"
+            )
+            == "0.1"
+        )
+        assert mock_getenv.call_count == 2
+
+        self.config_manager.clear_cache()
+        self.config_manager._get_env_var("llm_model_id")
+
+        assert mock_getenv.call_count == 3
+
+    @patch("src.agent.utils.config_manager.getenv")
+    def test_database_configs_share_postgres_credentials(self, mock_getenv):
+        """Test that both database configs build on the same credential read."""
+        mock_getenv.side_effect = lambda key, default=None: {
+            "PG_USER": "user",
+            "PG_PASSWORD": "secret",
+            "PG_HOST": "localhost",
+            "PG_PORT": "5432",
+            "PG_NAME": "app",
+        }.get(key, default)
+
+        database_config = self.config_manager.get_database_config()
+        evaluation_config = self.config_manager.get_evaluation_database_config()
+
+        assert "user:secret@localhost:5432" in database_config["connection_string"]
+        assert "user:secret@localhost:5432" in evaluation_config["connection_string"]
+        assert (
+            sum(call.args[0] == "PG_USER" for call in mock_getenv.call_args_list) == 1
+        )
+
+    def test_connection_string_builder_matches_template(self):
+        """Test that the builder and the derived template share one format."""
+        parts = dict(user="u", password="p", host="h", port="5432", name="db")
+
+        connection_string = Database.build_connection_string(**parts)
+
+        assert connection_string == "postgresql+psycopg2://u:p@h:5432/db"
+        assert connection_string == Database.CONNECTION_STRING_TEMPLATE.format(**parts)
+
     def test_clear_cache_reloads_configuration(self):
         """Test that clear_cache allows fresh configuration loading."""
         with patch.object(
@@ -164,3 +272,42 @@ class TestConfigurationManagerIntegration:
         assert llm_config["temperature"] == "0.5"
         assert guardrails_config["model_id"] == "guard-model"
         assert guardrails_config["temperature"] == "0.3"
+
+
+class TestBackwardCompatibleGetters:
+    """Test the lazily bound module-level get_*_config helpers."""
+
+    def test_getter_is_created_once_on_first_access(self):
+        """Test that module getters are built lazily and then cached."""
+        from src.agent.utils import config_manager
+
+        config_manager.__dict__.pop("get_slack_config", None)
+
+        getter = config_manager.get_slack_config
+
+        assert getter.__name__ == "get_slack_config"
+        assert config_manager.__dict__["get_slack_config"] is getter
+
+    @patch("src.agent.utils.config_manager.getenv")
+    def test_getter_follows_singleton_after_reset(self, mock_getenv):
+        """Test that a getter reads from the new instance after reset_instance."""
+        from src.agent.utils import config_manager
+
+        env = {"llm_model_id": "first-model", "llm_temperature": "0.1"}
+        mock_getenv.side_effect = lambda key, default=None: env.get(key, default)
+        ConfigurationManager.reset_instance()
+        get_llm_config = config_manager.get_llm_config
+
+        assert get_llm_config()["model_id"] == "first-model"
+
+        ConfigurationManager.reset_instance()
+        env["llm_model_id"] = "second-model"
+
+        assert get_llm_config()["model_id"] == "second-model"
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test that unrelated names still raise AttributeError."""
+        from src.agent.utils import config_manager
+
+        with pytest.raises(AttributeError):
+            config_manager.get_unknown_config
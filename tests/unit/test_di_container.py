@@ -2,6 +2,7 @@
 
 import pytest
 from abc import ABC, abstractmethod
+from unittest.mock import patch
 
 from src.agent.utils.di_container import DIContainer, Lifetime
 
@@ -109,6 +110,21 @@ class TestDIContainerBasics:
         assert isinstance(dependent.service, ConcreteService)
         assert dependent.process() == "DependentService using: ConcreteService executed"
 
+    def test_should_inspect_constructor_once_per_type(self):
+        """Test that constructor signatures are cached across resolutions."""
+        container = DIContainer()
+        container.register(AbstractService, ConcreteService, Lifetime.SINGLETON)
+        container.register(DependentService, DependentService, Lifetime.TRANSIENT)
+        container.resolve(DependentService)
+
+        with patch("src.agent.utils.di_container.inspect.signature") as mock_signature:
+            first = container.resolve(DependentService)
+            second = container.resolve(DependentService)
+
+        mock_signature.assert_not_called()
+        assert first is not second
+        assert first.service is second.service
+
     def test_should_raise_error_for_unregistered_type(self):
         """Test that resolving unregistered type raises error."""
         container = DIContainer()
@@ -191,6 +207,19 @@ class TestDIContainerScoped:
         assert parent_service.execute() == "ConcreteService executed"
         assert child_service.execute() == "ChildService executed"
 
+    def test_should_see_parent_registration_changes_after_cached_lookup(self):
+        """Test that cached parent lookups are invalidated by new registrations."""
+        parent = DIContainer()
+        parent.register(AbstractService, ConcreteService, Lifetime.TRANSIENT)
+        scope = parent.create_scope()
+
+        assert isinstance(scope.resolve(AbstractService), ConcreteService)
+
+        replacement = ConcreteService()
+        parent.register_instance(AbstractService, replacement)
+
+        assert scope.resolve(AbstractService) is replacement
+
 
 class TestDIContainerLifecycle:
     """Test lifecycle management functionality."""
@@ -206,3 +235,41 @@ class TestDIContainerLifecycle:
 
         # Resource should be disposed after context exits
         assert service.disposed
+
+    def test_should_track_resolved_singleton_once_per_container(self):
+        """Test that repeated singleton resolutions are tracked for disposal once."""
+        container = DIContainer()
+        container.register(DisposableService, DisposableService, Lifetime.SINGLETON)
+
+        scope = container.create_scope()
+        for _ in range(3):
+            scope.resolve(DisposableService)
+            container.resolve(DisposableService)
+
+        assert len(scope._disposables) == 1
+        assert len(container._disposables) == 1
+
+    def test_should_dispose_transients_with_cached_disposer(self):
+        """Test that every transient of a type is disposed via one cached routine."""
+        from src.agent.utils.di_container import _DISPOSERS
+
+        container = DIContainer()
+        container.register(DisposableService, DisposableService, Lifetime.TRANSIENT)
+
+        with container.create_scope() as scope:
+            first = scope.resolve(DisposableService)
+            second = scope.resolve(DisposableService)
+
+        assert first.disposed and second.disposed
+        assert DisposableService in _DISPOSERS
+
+    def test_should_not_dispose_registered_instances(self):
+        """Test that instances registered by the caller are left to their owner."""
+        container = DIContainer()
+        service = DisposableService()
+        container.register_instance(DisposableService, service)
+
+        with container.create_scope() as scope:
+            assert scope.resolve(DisposableService) is service
+
+        assert not service.disposed
@@ -643,3 +643,73 @@ class TestScenario:
         assert fake_notifs.sent["test_scenario_id"][5] == scenario_validation
         assert fake_notifs.sent["test_scenario_id"][6] == end_of_event
         assert len(fake_notifs.sent["test_scenario_id"]) == 7
+
+
+class FailingNotifications(AbstractNotifications):
+    def send(self, destination, event: events.Event):
+        raise RuntimeError("notification down")
+
+
+class TestNotify:
+    @pytest.mark.asyncio
+    async def test_notify_sends_to_all_batches(self):
+        from src.agent.service_layer import handlers
+
+        notifications = [
+            FakeNotifications() for _ in range(handlers.NOTIFICATION_BATCH_SIZE + 5)
+        ]
+        event = events.EndOfEvent(q_id="test_notify_id")
+
+        await handlers._notify(notifications, "test_notify_id", event)
+
+        assert all(n.sent["test_notify_id"] == [event] for n in notifications)
+
+    @pytest.mark.asyncio
+    async def test_notify_isolates_failing_notification(self):
+        from src.agent.service_layer import handlers
+
+        fake_notifs = FakeNotifications()
+        event = events.EndOfEvent(q_id="test_notify_id")
+
+        await handlers._notify(
+            [FailingNotifications(), fake_notifs], "test_notify_id", event
+        )
+
+        assert fake_notifs.sent["test_notify_id"] == [event]
+
+    @pytest.mark.asyncio
+    async def test_notify_batch_preserves_order(self):
+        from src.agent.service_layer import handlers
+
+        fake_notifs = FakeNotifications()
+        status = events.StatusUpdate(step_name="Processing...", q_id="test_batch_id")
+        end = events.EndOfEvent(q_id="test_batch_id")
+
+        await handlers._notify_batch(
+            [fake_notifs], [("test_batch_id", status), ("test_batch_id", end)]
+        )
+
+        assert fake_notifs.sent["test_batch_id"] == [status, end]
+
+
+class TestUpdateTrace:
+    def test_skipped_for_unsampled_request(self, monkeypatch):
+        from src.agent.observability.context import ctx_trace_sampled
+        from src.agent.service_layer import handlers
+        from src.agent.utils.constants import EnvVars
+
+        langfuse = Mock()
+        monkeypatch.setattr(handlers, "_get_langfuse", lambda: langfuse)
+        monkeypatch.setenv(EnvVars.TELEMETRY_ACTIVE, "true")
+
+        token = ctx_trace_sampled.set(False)
+        try:
+            handlers._update_trace(name="answer", session_id="q1")
+        finally:
+            ctx_trace_sampled.reset(token)
+        langfuse.update_current_trace.assert_not_called()
+
+        handlers._update_trace(name="answer", session_id="q1")
+        langfuse.update_current_trace.assert_called_once_with(
+            name="answer", session_id="q1"
+        )
@@ -297,3 +297,42 @@ class TestMessageBusEventHandlingWithErrors:
         # Both handlers should be called
         failing_handler.assert_called_once()
         successful_handler.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_event_handler_is_logged_without_cancelling_siblings(self):
+        """Test that a handler failure is logged and slower siblings still finish."""
+        import asyncio
+
+        from loguru import logger
+
+        adapter = Mock()
+        adapter.collect_new_events = Mock(return_value=[])
+        finished = []
+
+        async def failing_handler(event):
+            raise RuntimeError("Handler failed")
+
+        async def slow_handler(event):
+            await asyncio.sleep(0.01)
+            finished.append(event.q_id)
+
+        bus = MessageBus(
+            adapter=adapter,
+            command_handlers={},
+            event_handlers={events.Response: [failing_handler, slow_handler]},
+        )
+
+        records = []
+        handler_id = logger.add(lambda message: records.append(message.record))
+        try:
+            await bus.handle(
+                events.Response(question="Test", response="Answer", q_id="test123")
+            )
+        finally:
+            logger.remove(handler_id)
+
+        assert finished == ["test123"]
+        errors = [record for record in records if record["level"].name == "ERROR"]
+        assert len(errors) == 1
+        assert "failing_handler" in errors[0]["message"]
+        assert isinstance(errors[0]["exception"].value, RuntimeError)
@@ -0,0 +1,196 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.domain import events
+from src.agent.observability import sampling
+from src.agent.observability.context import ctx_trace_sampled
+from src.agent.utils.constants import EnvVars
+
+
+class TestIsInSample:
+    def test_full_rate_always_samples(self):
+        assert sampling.is_in_sample("any-id", 1.0)
+
+    def test_zero_rate_never_samples(self):
+        assert not sampling.is_in_sample("any-id", 0.0)
+
+    def test_decision_is_consistent_per_key(self):
+        decisions = {sampling.is_in_sample("session-42", 0.5) for _ in range(10)}
+        assert len(decisions) == 1
+
+    def test_rate_controls_sampled_fraction(self):
+        sampled = sum(sampling.is_in_sample(f"q{i}", 0.25) for i in range(4000))
+        assert 800 < sampled < 1200
+
+
+class TestSampledObserve:
+    @pytest.mark.asyncio
+    async def test_unsampled_message_skips_observe(self):
+        calls = []
+
+        with patch.object(sampling, "observe") as mock_observe:
+
+            async def observed(*args, **kwargs):
+                pytest.fail("observed handler should not be called")
+
+            mock_observe.return_value = lambda func: observed
+
+            @sampling.sampled_observe(rate=0.0)
+            async def handler(event, notifications=None):
+                calls.append(event)
+
+            event = events.EndOfEvent(q_id="q1")
+            await handler(event)
+
+        assert calls == [event]
+
+    @pytest.mark.asyncio
+    async def test_sampled_message_uses_observe(self):
+        observed_calls = []
+
+        def fake_observe(**kwargs):
+            def decorator(func):
+                async def observed(*args, **kw):
+                    observed_calls.append(args[0])
+                    return await func(*args, **kw)
+
+                return observed
+
+            return decorator
+
+        with (
+            patch.object(sampling, "observe", side_effect=fake_observe),
+            patch.dict("os.environ", {"TELEMETRY_ENABLED": "true"}),
+        ):
+
+            @sampling.sampled_observe(rate=1.0)
+            async def handler(event, notifications=None):
+                return event.q_id
+
+            result = await handler(events.EndOfEvent(q_id="q1"))
+
+        assert result == "q1"
+        assert len(observed_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_telemetry_skips_observe(self):
+        with (
+            patch.object(sampling, "observe") as mock_observe,
+            patch.dict("os.environ", {"TELEMETRY_ENABLED": "false"}),
+        ):
+
+            async def observed(*args, **kwargs):
+                pytest.fail("observed handler should not be called")
+
+            mock_observe.return_value = lambda func: observed
+
+            @sampling.sampled_observe(rate=1.0)
+            async def handler(event, notifications=None):
+                return event.q_id
+
+            assert await handler(events.EndOfEvent(q_id="q1")) == "q1"
+
+    def test_sample_rate_is_read_from_environment(self):
+        sampling.get_sample_rate.cache_clear()
+        try:
+            with patch.dict("os.environ", {"langfuse_sample_rate": "0.3"}):
+                assert sampling.get_sample_rate() == 0.3
+
+            sampling.get_sample_rate.cache_clear()
+            with patch.dict("os.environ", {"langfuse_sample_rate": "7"}):
+                assert sampling.get_sample_rate() == 1.0
+        finally:
+            sampling.get_sample_rate.cache_clear()
+
+    def test_sample_rate_is_parsed_once(self):
+        sampling.get_sample_rate.cache_clear()
+        try:
+            with patch.dict("os.environ", {"langfuse_sample_rate": "0.3"}):
+                assert sampling.get_sample_rate() == 0.3
+
+            with patch.dict("os.environ", {"langfuse_sample_rate": "0.9"}):
+                assert sampling.get_sample_rate() == 0.3
+        finally:
+            sampling.get_sample_rate.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_decision_is_visible_to_nested_calls(self):
+        seen = []
+
+        with patch.dict("os.environ", {EnvVars.TELEMETRY_ACTIVE: "true"}):
+
+            @sampling.sampled_observe(rate=0.0)
+            async def handler(event, notifications=None):
+                seen.append(sampling.is_trace_sampled())
+
+            await handler(events.EndOfEvent(q_id="q1"))
+
+        assert seen == [False]
+        assert sampling.is_trace_sampled()
+
+
+class TestObserveSampled:
+    def test_sync_function_skips_observe_when_unsampled(self):
+        with patch.object(sampling, "observe") as mock_observe:
+
+            def observed(*args, **kwargs):
+                pytest.fail("observed function should not be called")
+
+            mock_observe.return_value = lambda func: observed
+
+            @sampling.observe_sampled(as_type="generation")
+            def adapter_call(value):
+                return value * 2
+
+            token = ctx_trace_sampled.set(False)
+            try:
+                assert adapter_call(2) == 4
+            finally:
+                ctx_trace_sampled.reset(token)
+
+    @pytest.mark.asyncio
+    async def test_async_function_uses_observe_when_sampled(self):
+        observed_calls = []
+
+        def fake_observe(**kwargs):
+            def decorator(func):
+                async def observed(*args, **kw):
+                    observed_calls.append(args)
+                    return await func(*args, **kw)
+
+                return observed
+
+            return decorator
+
+        with patch.object(sampling, "observe", side_effect=fake_observe):
+
+            @sampling.observe_sampled()
+            async def adapter_call(value):
+                return value * 2
+
+            assert await adapter_call(2) == 4
+
+        assert observed_calls == [(2,)]
+
+    @pytest.mark.asyncio
+    async def test_unsampled_handler_opens_no_adapter_spans(self):
+        with (
+            patch.object(sampling, "observe") as mock_observe,
+            patch.dict("os.environ", {EnvVars.TELEMETRY_ACTIVE: "true"}),
+        ):
+
+            async def observed(*args, **kwargs):
+                pytest.fail("no span should be opened for an unsampled request")
+
+            mock_observe.return_value = lambda func: observed
+
+            @sampling.observe_sampled()
+            async def adapter_call(command):
+                return command.q_id
+
+            @sampling.sampled_observe(rate=0.0)
+            async def handler(event, notifications=None):
+                return await adapter_call(event)
+
+            assert await handler(events.EndOfEvent(q_id="q1")) == "q1"
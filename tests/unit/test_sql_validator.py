@@ -177,3 +177,51 @@ class TestSQLValidator:
             with pytest.raises(ValueError) as exc_info:
                 self.validator.validate(sql_query)
             assert "Empty SQL query" in str(exc_info.value)
+
+    def test_reports_first_forbidden_operation_in_query(self):
+        """Should report the earliest forbidden keyword when several appear."""
+        # Arrange
+        sql_query = "SELECT * FROM (DELETE FROM users RETURNING *); DROP TABLE users;"
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.validator.validate(sql_query)
+
+        assert "DELETE operations are not allowed" in str(exc_info.value)
+
+    def test_matches_forbidden_operations_as_whole_words(self):
+        """Should distinguish overlapping keywords and ignore identifiers."""
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.validator.validate("EXECUTE my_procedure")
+        assert "EXECUTE operations are not allowed" in str(exc_info.value)
+
+        assert self.validator.validate("SELECT created_at, updated_by FROM audit;")
+
+    def test_validator_instances_carry_no_state(self):
+        """Should keep all compiled state on the class, not per instance."""
+        assert not hasattr(self.validator, "__dict__")
+
+    def test_ignores_semicolons_inside_literals_and_comments(self):
+        """Should not treat semicolons in strings or comments as separators."""
+        # Arrange
+        sql_queries = [
+            "SELECT ';' AS sep FROM users;",
+            "SELECT id FROM users -- trailing; comment",
+            "SELECT id /* a; b */ FROM users;",
+        ]
+
+        # Act & Assert
+        for sql_query in sql_queries:
+            assert self.validator.validate(sql_query) is True
+
+    def test_quotes_inside_comments_do_not_hide_statements(self):
+        """Should strip comments and literals in source order."""
+        # Arrange
+        sql_query = "SELECT 1 /* it's */; SELECT 2 /* ' */"
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.validator.validate(sql_query)
+
+        assert "Multiple SQL statements are not allowed" in str(exc_info.value)
@@ -0,0 +1,21 @@
+import pytest
+
+from src.agent.utils.template import _compile_template, populate_template
+
+
+def test_populate_template_renders_variables():
+    assert populate_template("Hello {{ name }}", {"name": "agent"}) == "Hello agent"
+
+
+def test_populate_template_reuses_compiled_template():
+    _compile_template.cache_clear()
+
+    populate_template("Question: {{ question }}", {"question": "a"})
+    populate_template("Question: {{ question }}", {"question": "b"})
+
+    assert _compile_template.cache_info().hits == 1
+
+
+def test_populate_template_raises_on_missing_variable():
+    with pytest.raises(Exception, match="UndefinedError"):
+        populate_template("Hello {{ name }}", {})